@@ -0,0 +1,226 @@
+import asyncio
+import logging
+import sys
+import time
+from concurrent.futures import Future, InvalidStateError
+from queue import Queue, Empty
+from threading import Thread, Event, Lock
+from typing import Any, Dict, List
+
+
+class PendingPrediction:
+    __slots__ = ('data', 'future', 'enqueued_at', 'cache_key')
+
+    def __init__(self, data: Any, cache_key=None):
+        self.data = data
+        self.future = Future()
+        self.enqueued_at = time.perf_counter()
+        self.cache_key = cache_key
+
+
+class BatchMetrics:
+    def __init__(self):
+        self.requests = 0
+        self.batches = 0
+        self.errors = 0
+        self.max_batch_size = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.total_predict_time = 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            'requests': self.requests,
+            'batches': self.batches,
+            'errors': self.errors,
+            'avg_batch_size': self.requests / self.batches if self.batches else 0.0,
+            'max_batch_size': self.max_batch_size,
+            'avg_wait_ms': self.total_wait / self.requests * 1000 if self.requests else 0.0,
+            'max_wait_ms': self.max_wait * 1000,
+            'avg_predict_ms': self.total_predict_time / self.batches * 1000 if self.batches else 0.0
+        }
+
+
+class BatchingPredictor:
+    # Concurrent predict() calls for the same model are queued and handed to one collector thread per model,
+    # which calls model.predict once per batch of up to max_batch_size inputs. No request waits more than
+    # max_wait seconds for its batch to fill.
+    def __init__(self, model_registry, max_batch_size: int = 32, max_wait: float = 0.005, prediction_cache=None):
+        self.logger = logging.getLogger(__name__)
+        self.model_registry = model_registry
+        self.prediction_cache = prediction_cache if prediction_cache is not None else model_registry.prediction_cache
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait  # seconds
+        self.queues: Dict[str, Queue] = {}
+        self.workers: Dict[str, Thread] = {}
+        self.metrics: Dict[str, BatchMetrics] = {}
+        self.lock = Lock()
+        self.stop_event = Event()
+
+    def _get_queue(self, model_name: str) -> Queue:
+        model_queue = self.queues.get(model_name)
+        if model_queue is None:
+            with self.lock:
+                model_queue = self.queues.get(model_name)
+                if model_queue is None:
+                    model_queue = Queue()
+                    self.metrics[model_name] = BatchMetrics()
+                    worker = Thread(target=self._collect, args=(model_name, model_queue),
+                                    name=f"batcher-{model_name}", daemon=True)
+                    self.workers[model_name] = worker
+                    self.queues[model_name] = model_queue
+                    worker.start()
+        return model_queue
+
+    def submit(self, model_name: str, data: Any) -> Future:
+        if self.stop_event.is_set():
+            raise RuntimeError("BatchingPredictor has been stopped")
+        cache_key = None
+        if self.prediction_cache is not None:
+            # Cache hits are answered immediately and never take a batch slot
+            cache_key = (self.model_registry.get_model_version(model_name), self.prediction_cache.fingerprint(data))
+            hit, value = self.prediction_cache.get(model_name, *cache_key)
+            if hit:
+                future = Future()
+                future.set_result(value)
+                return future
+        pending = PendingPrediction(data, cache_key)
+        self._get_queue(model_name).put(pending)
+        return pending.future
+
+    def predict(self, model_name: str, data: Any, timeout: float = None) -> Any:
+        return self.submit(model_name, data).result(timeout)
+
+    async def predict_async(self, model_name: str, data: Any) -> Any:
+        return await asyncio.wrap_future(self.submit(model_name, data))
+
+    def _collect(self, model_name: str, model_queue: Queue):
+        while not self.stop_event.is_set():
+            try:
+                first = model_queue.get(timeout=0.1)
+            except Empty:
+                continue
+
+            batch = [first]
+            deadline = first.enqueued_at + self.max_wait
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - time.perf_counter()
+                try:
+                    batch.append(model_queue.get(timeout=remaining) if remaining > 0 else model_queue.get_nowait())
+                except Empty:
+                    break
+            try:
+                self._run_batch(model_name, batch)
+            except Exception as e:
+                # One bad request must never end the collector, or every later call for this model hangs
+                self.logger.error(f"Unexpected error in batch collector for model {model_name}: {str(e)}")
+                for pending in batch:
+                    if not pending.future.done():
+                        self._resolve(pending, error=e)
+
+    @staticmethod
+    def _resolve(pending: PendingPrediction, result: Any = None, error: Exception = None):
+        try:
+            if error is not None:
+                pending.future.set_exception(error)
+            else:
+                pending.future.set_result(result)
+        except InvalidStateError:
+            pass  # cancelled by its caller after the batch started
+
+    @staticmethod
+    def _group_key(data: Any):
+        # Only inputs that stack together share a model call, so a malformed request fails on its own
+        np = sys.modules.get('numpy')
+        if np is not None and isinstance(data, np.ndarray):
+            return ('block', data.shape[1:]) if data.ndim >= 2 else ('row', data.shape)
+        return ('list',)
+
+    def _run_batch(self, model_name: str, batch: List[PendingPrediction]):
+        # Claiming each future makes later cancels fail, and drops callers who gave up while queued
+        batch = [pending for pending in batch if pending.future.set_running_or_notify_cancel()]
+        if not batch:
+            return
+        metrics = self.metrics[model_name]
+        started = time.perf_counter()
+        for pending in batch:
+            wait = started - pending.enqueued_at
+            metrics.total_wait += wait
+            metrics.max_wait = max(metrics.max_wait, wait)
+        metrics.requests += len(batch)
+        metrics.batches += 1
+        metrics.max_batch_size = max(metrics.max_batch_size, len(batch))
+
+        groups: Dict[Any, List[PendingPrediction]] = {}
+        for pending in batch:
+            groups.setdefault(self._group_key(pending.data), []).append(pending)
+
+        try:
+            model = self.model_registry.get_model(model_name)
+            if model is None:
+                raise ValueError(f"Model {model_name} not found")
+        except Exception as e:
+            metrics.errors += 1
+            self.logger.error(f"Error in batched prediction for model {model_name}: {str(e)}")
+            for pending in batch:
+                self._resolve(pending, error=e)
+            return
+
+        for group in groups.values():
+            try:
+                stacked, sizes = self._stack([pending.data for pending in group])
+                results = self._scatter(model.predict(stacked), sizes, len(group))
+            except Exception as e:
+                metrics.errors += 1
+                self.logger.error(f"Error in batched prediction for model {model_name}: {str(e)}")
+                for pending in group:
+                    self._resolve(pending, error=e)
+                continue
+            for pending, result in zip(group, results):
+                if pending.cache_key is not None:
+                    self.prediction_cache.put(model_name, *pending.cache_key, result)
+                self._resolve(pending, result)
+        metrics.total_predict_time += time.perf_counter() - started
+
+    @staticmethod
+    def _stack(inputs: List[Any]):
+        # NumPy inputs are merged into one array: single rows are stacked, row blocks are concatenated and
+        # remembered by size so the output can be split back. Anything else is passed as a list of inputs.
+        np = sys.modules.get('numpy')
+        if np is not None and all(isinstance(item, np.ndarray) for item in inputs):
+            if all(item.ndim >= 2 for item in inputs):
+                return np.concatenate(inputs), [len(item) for item in inputs]
+            if len({item.shape for item in inputs}) == 1:
+                return np.stack(inputs), None
+        return list(inputs), None
+
+    @staticmethod
+    def _scatter(outputs: Any, sizes, count: int):
+        expected = sum(sizes) if sizes is not None else count
+        if len(outputs) != expected:
+            raise ValueError(f"Model returned {len(outputs)} outputs for {expected} inputs")
+        if sizes is None:
+            return list(outputs)
+        results, offset = [], 0
+        for size in sizes:
+            results.append(outputs[offset:offset + size])
+            offset += size
+        return results
+
+    def get_metrics(self, model_name: str = None) -> Dict[str, Any]:
+        if model_name is not None:
+            metrics = self.metrics.get(model_name)
+            return metrics.as_dict() if metrics else {}
+        return {name: metrics.as_dict() for name, metrics in self.metrics.items()}
+
+    def stop(self):
+        self.logger.info("Stopping BatchingPredictor")
+        self.stop_event.set()
+        for worker in self.workers.values():
+            worker.join()
+        for model_queue in self.queues.values():
+            while True:
+                try:
+                    self._resolve(model_queue.get_nowait(), error=RuntimeError("BatchingPredictor stopped"))
+                except Empty:
+                    break
@@ -1,19 +1,84 @@
+import asyncio
+import concurrent.futures
+import functools
+import hashlib
+import inspect
 import logging
-from typing import Dict, Any
+import pickle
+import threading
+import time
+import weakref
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional
 
-class ConnectorHub:
+
+class _InFlightCall:
     def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class _SharedCall:
+    def __init__(self, future: asyncio.Future):
+        self.future = future
+        self.waiters = 0
+
+
+class ConnectorHub:
+    def __init__(self, max_workers: int = 32, default_concurrency: int = 8, default_timeout: Optional[float] = 30.0,
+                 http_pool_size: int = 32, coalesce: bool = True, hedge_percentile: Optional[float] = None,
+                 hedge_min_samples: int = 20, latency_window: int = 200):
         self.logger = logging.getLogger(__name__)
         self.connectors: Dict[str, Any] = {}
+        self.max_workers = max_workers  # upper bound on each connector's thread pool
+        self.default_concurrency = default_concurrency
+        self.default_timeout = default_timeout  # seconds
+        self.http_pool_size = http_pool_size
+        self.concurrency_limits: Dict[str, int] = {}
+        # asyncio primitives are bound to the loop that first uses them, so semaphores are kept per loop
+        self.semaphores: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()  # loop -> {name: Semaphore}
+        # Each connector gets its own bounded pool, so abandoned calls to a slow provider cannot tie up
+        # threads that other connectors need
+        self.executors: Dict[str, ThreadPoolExecutor] = {}
+        self.http_session = None
+        self.pending: set = set()
+        # Identical in-flight calls share one execution; keys are (connector, task, args, kwargs)
+        self.coalesce = coalesce
+        self.inflight: Dict[Any, _InFlightCall] = {}
+        self.inflight_async: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()  # loop -> {key: _SharedCall}
+        self.inflight_lock = threading.Lock()
+        # With hedging on, a call slower than this latency percentile of its connector gets a second
+        # attempt on another connector of the same type; None disables hedging
+        self.hedge_percentile = hedge_percentile
+        self.hedge_min_samples = hedge_min_samples
+        self.latency_window = latency_window
+        self.connector_types: Dict[str, str] = {}
+        self.latencies: Dict[str, deque] = {}
+        self.call_stats = {'coalesced': 0, 'hedged': 0, 'hedge_wins': 0}
 
-    def add_connector(self, name: str, connector: Any):
+    def add_connector(self, name: str, connector: Any, max_concurrency: int = None, connector_type: str = None):
         self.logger.info(f"Adding connector: {name}")
         self.connectors[name] = connector
+        self.connector_types[name] = connector_type or type(connector).__name__
+        self.latencies[name] = deque(maxlen=self.latency_window)
+        self.concurrency_limits[name] = max_concurrency or self.default_concurrency
+        self._drop_semaphores(name)
+        self._drop_executor(name)
+        # HTTP-backed connectors share one keep-alive pool instead of opening a connection per call
+        if hasattr(connector, 'set_session'):
+            connector.set_session(self.get_http_session())
 
     def remove_connector(self, name: str):
         if name in self.connectors:
             self.logger.info(f"Removing connector: {name}")
             del self.connectors[name]
+            self.concurrency_limits.pop(name, None)
+            self._drop_semaphores(name)
+            self._drop_executor(name)
+            self.connector_types.pop(name, None)
+            self.latencies.pop(name, None)
         else:
             self.logger.warning(f"Connector {name} not found")
 
@@ -29,9 +94,292 @@ class ConnectorHub:
 
     def execute_task(self, connector_name: str, task: str, *args, **kwargs):
         connector = self.get_connector(connector_name)
-        if connector:
-            self.logger.info(f"Executing task '{task}' on connector '{connector_name}'")
-            return connector.execute(task, *args, **kwargs)
-        else:
+        if not connector:
             self.logger.error(f"Failed to execute task. Connector '{connector_name}' not found")
-            return None
\ No newline at end of file
+            return None
+
+        self.logger.info(f"Executing task '{task}' on connector '{connector_name}'")
+        key = self._call_key(connector_name, task, args, kwargs) if self.coalesce else None
+        if key is None:
+            return self._execute_blocking(connector_name, task, args, kwargs)
+
+        with self.inflight_lock:
+            call = self.inflight.get(key)
+            leader = call is None
+            if leader:
+                call = _InFlightCall()
+                self.inflight[key] = call
+            else:
+                self.call_stats['coalesced'] += 1
+        if not leader:
+            # Followers get the leader's result object itself, not a copy
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = self._execute_blocking(connector_name, task, args, kwargs)
+            return call.result
+        except Exception as e:
+            call.error = e
+            raise
+        finally:
+            with self.inflight_lock:
+                self.inflight.pop(key, None)
+            call.done.set()
+
+    @staticmethod
+    def _call_key(connector_name: str, task: str, args, kwargs):
+        key = (connector_name, task, args, tuple(sorted(kwargs.items())))
+        try:
+            hash(key)
+            return key
+        except TypeError:
+            pass
+        try:
+            payload = pickle.dumps((args, sorted(kwargs.items())))
+        except Exception:
+            return None  # arguments we cannot fingerprint are never coalesced
+        return connector_name, task, hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+    def _record_latency(self, connector_name: str, seconds: float):
+        samples = self.latencies.get(connector_name)
+        if samples is not None:
+            samples.append(seconds)
+
+    def _latency_percentile(self, connector_name: str, percentile: float) -> Optional[float]:
+        samples = self.latencies.get(connector_name)
+        if not samples or len(samples) < self.hedge_min_samples:
+            return None
+        ordered = sorted(samples)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * percentile / 100))]
+
+    def _hedge_plan(self, connector_name: str):
+        # Returns (delay, backup connector name) or None when the call should not be hedged
+        if self.hedge_percentile is None:
+            return None
+        delay = self._latency_percentile(connector_name, self.hedge_percentile)
+        if delay is None:
+            return None
+        connector_type = self.connector_types.get(connector_name)
+        peers = [name for name, peer_type in self.connector_types.items()
+                 if peer_type == connector_type and name != connector_name]
+        if not peers:
+            return None
+        # Prefer the peer with the lowest typical latency; peers without history count as fast
+        backup = min(peers, key=lambda name: self._latency_percentile(name, 50) or 0.0)
+        return delay, backup
+
+    def _timed_execute(self, connector_name: str, task: str, args, kwargs):
+        started = time.perf_counter()
+        result = self.connectors[connector_name].execute(task, *args, **kwargs)
+        self._record_latency(connector_name, time.perf_counter() - started)
+        return result
+
+    def _execute_blocking(self, connector_name: str, task: str, args, kwargs):
+        plan = self._hedge_plan(connector_name)
+        if plan is None:
+            return self._timed_execute(connector_name, task, args, kwargs)
+
+        delay, backup = plan
+        primary = self._get_executor(connector_name).submit(self._timed_execute, connector_name, task, args, kwargs)
+        try:
+            return primary.result(timeout=delay)
+        except concurrent.futures.TimeoutError:
+            pass
+        self.call_stats['hedged'] += 1
+        self.logger.info(f"Hedging task '{task}' from connector '{connector_name}' to '{backup}' after {delay:.3f}s")
+        hedge = self._get_executor(backup).submit(self._timed_execute, backup, task, args, kwargs)
+        pending = {primary, hedge}
+        while pending:
+            done, pending = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    if future is hedge:
+                        self.call_stats['hedge_wins'] += 1
+                    return future.result()
+        # Both attempts failed; surface the primary connector's error
+        return primary.result()
+
+    def get_http_session(self):
+        if self.http_session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            self.http_session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=self.http_pool_size, pool_maxsize=self.http_pool_size)
+            self.http_session.mount('http://', adapter)
+            self.http_session.mount('https://', adapter)
+        return self.http_session
+
+    def _get_executor(self, connector_name: str) -> ThreadPoolExecutor:
+        executor = self.executors.get(connector_name)
+        if executor is None:
+            workers = min(self.max_workers, self.concurrency_limits.get(connector_name, self.default_concurrency))
+            executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix=f"connector-{connector_name}")
+            self.executors[connector_name] = executor
+        return executor
+
+    def _drop_executor(self, connector_name: str):
+        executor = self.executors.pop(connector_name, None)
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+    def _drop_semaphores(self, connector_name: str):
+        for semaphores in list(self.semaphores.values()):
+            semaphores.pop(connector_name, None)
+
+    def _get_semaphore(self, connector_name: str) -> asyncio.Semaphore:
+        semaphores = self.semaphores.setdefault(asyncio.get_running_loop(), {})
+        semaphore = semaphores.get(connector_name)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.concurrency_limits.get(connector_name, self.default_concurrency))
+            semaphores[connector_name] = semaphore
+        return semaphore
+
+    async def execute_task_async(self, connector_name: str, task: str, *args, timeout: Optional[float] = None,
+                                 **kwargs):
+        connector = self.get_connector(connector_name)
+        if not connector:
+            self.logger.error(f"Failed to execute task. Connector '{connector_name}' not found")
+            return None
+
+        timeout = self.default_timeout if timeout is None else timeout
+        self.logger.info(f"Executing task '{task}' on connector '{connector_name}' (async)")
+        key = self._call_key(connector_name, task, args, kwargs) if self.coalesce else None
+        if key is None:
+            # The deadline covers time spent waiting for a concurrency slot as well as the call itself
+            return await asyncio.wait_for(self._run_call(connector_name, task, args, kwargs), timeout)
+
+        # Shared futures belong to the loop that created them, so calls only coalesce within one loop
+        inflight = self.inflight_async.setdefault(asyncio.get_running_loop(), {})
+        call = inflight.get(key)
+        if call is None:
+            call = _SharedCall(asyncio.ensure_future(self._run_call(connector_name, task, args, kwargs)))
+            inflight[key] = call
+            call.future.add_done_callback(lambda _: inflight.pop(key) if inflight.get(key) is call else None)
+        else:
+            self.call_stats['coalesced'] += 1
+
+        # Each caller keeps its own deadline; the shared call is only cancelled once nobody waits for it
+        call.waiters += 1
+        try:
+            return await asyncio.wait_for(asyncio.shield(call.future), timeout)
+        finally:
+            call.waiters -= 1
+            if call.waiters == 0 and not call.future.done():
+                call.future.cancel()
+
+    async def _run_call(self, connector_name: str, task: str, args, kwargs):
+        plan = self._hedge_plan(connector_name)
+        if plan is None:
+            return await self._call_connector(connector_name, task, args, kwargs)
+
+        delay, backup = plan
+        acquired = asyncio.Event()
+        primary = asyncio.ensure_future(self._call_connector(connector_name, task, args, kwargs, acquired))
+        pending = {primary}
+        try:
+            # The hedge clock starts once the primary holds a concurrency slot, so queueing behind a
+            # saturated connector does not fan extra load out to its peers
+            slot = asyncio.ensure_future(acquired.wait())
+            await asyncio.wait({primary, slot}, return_when=asyncio.FIRST_COMPLETED)
+            slot.cancel()
+            done, _ = await asyncio.wait(pending, timeout=delay)
+            if done:
+                return primary.result()
+            self.call_stats['hedged'] += 1
+            self.logger.info(f"Hedging task '{task}' from connector '{connector_name}' to '{backup}' after {delay:.3f}s")
+            hedge = asyncio.ensure_future(self._call_connector(backup, task, args, kwargs))
+            pending.add(hedge)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for future in done:
+                    if not future.cancelled() and future.exception() is None:
+                        if future is hedge:
+                            self.call_stats['hedge_wins'] += 1
+                        return future.result()
+            # Both attempts failed; surface the primary connector's error
+            return primary.result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+    async def _call_connector(self, connector_name: str, task: str, args, kwargs,
+                              acquired: Optional[asyncio.Event] = None):
+        connector = self.connectors[connector_name]
+        semaphore = self._get_semaphore(connector_name)
+        await semaphore.acquire()
+        if acquired is not None:
+            acquired.set()
+        started = time.perf_counter()
+        try:
+            execute_async = getattr(connector, 'execute_async', None)
+            if execute_async is not None and inspect.iscoroutinefunction(execute_async):
+                try:
+                    result = await execute_async(task, *args, **kwargs)
+                finally:
+                    semaphore.release()
+            else:
+                # A timed-out blocking call is abandoned, not interrupted, and keeps its thread busy; the slot
+                # is only handed back once the backend call really finishes, so the limit holds
+                loop = asyncio.get_running_loop()
+                try:
+                    future = self._get_executor(connector_name).submit(
+                        functools.partial(connector.execute, task, *args, **kwargs))
+                except Exception:
+                    semaphore.release()
+                    raise
+                future.add_done_callback(lambda _: self._release_threadsafe(loop, semaphore))
+                result = await asyncio.wrap_future(future)
+        except asyncio.CancelledError:
+            # A primary that lost to its hedge ran at least this long; dropping it would skew the
+            # percentile lower and make hedging ever more aggressive
+            self._record_latency(connector_name, time.perf_counter() - started)
+            raise
+        self._record_latency(connector_name, time.perf_counter() - started)
+        return result
+
+    @staticmethod
+    def _release_threadsafe(loop, semaphore: asyncio.Semaphore):
+        try:
+            loop.call_soon_threadsafe(semaphore.release)
+        except RuntimeError:
+            pass  # the loop has closed, and its semaphores with it
+
+    def submit_task(self, connector_name: str, task: str, *args, timeout: Optional[float] = None,
+                    **kwargs) -> asyncio.Task:
+        # Returns a handle the caller can cancel(); must be called from a running event loop
+        handle = asyncio.ensure_future(self.execute_task_async(connector_name, task, *args, timeout=timeout, **kwargs))
+        self.pending.add(handle)
+        handle.add_done_callback(self.pending.discard)
+        return handle
+
+    async def gather_tasks(self, calls: List[Dict[str, Any]], timeout: Optional[float] = None) -> List[Any]:
+        # Each call is {"connector": name, "task": task, "args": [...], "kwargs": {...}}; failures and
+        # timeouts are returned in place as exception objects so one slow backend does not sink the rest
+        handles = [self.submit_task(call["connector"], call["task"], *call.get("args", ()),
+                                    timeout=timeout, **call.get("kwargs", {}))
+                   for call in calls]
+        return await asyncio.gather(*handles, return_exceptions=True)
+
+    def get_call_metrics(self) -> Dict[str, Any]:
+        return {
+            **self.call_stats,
+            'in_flight': len(self.inflight) + sum(len(calls) for calls in self.inflight_async.values()),
+            'latency_p50': {name: self._latency_percentile(name, 50) for name in self.connectors},
+            'latency_p95': {name: self._latency_percentile(name, 95) for name in self.connectors}
+        }
+
+    def cancel_all(self):
+        for handle in list(self.pending):
+            handle.cancel()
+        self.logger.info("Cancelled all pending connector calls")
+
+    def shutdown(self):
+        self.cancel_all()
+        for name in list(self.executors):
+            self._drop_executor(name)
+        if self.http_session is not None:
+            self.http_session.close()
+            self.http_session = None
@@ -0,0 +1,109 @@
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+
+class EvaluationMetrics:
+    # Keeps only additive sums and counts, so partial results from separate shards merge exactly
+    def __init__(self, task: Optional[str] = None):
+        self.task = task  # 'classification' or 'regression'; inferred from the first batch when None
+        self.rows = 0
+        self.correct = 0
+        self.class_counts: Dict[Any, np.ndarray] = {}  # label -> [tp, fp, fn]
+        self.abs_error = 0.0
+        self.sq_error = 0.0
+        self.target_sum = 0.0
+        self.target_sq_sum = 0.0
+        self.batch_seconds = []
+        self.batch_rows = []
+
+    @staticmethod
+    def infer_task(y_true: np.ndarray) -> str:
+        if y_true.dtype.kind in 'biuUSO':
+            return 'classification'
+        return 'classification' if np.all(np.mod(y_true, 1) == 0) and len(np.unique(y_true)) <= 50 else 'regression'
+
+    def update(self, y_true: Any, y_pred: Any, seconds: float):
+        y_true = np.asarray(y_true).ravel()
+        y_pred = np.asarray(y_pred).ravel()
+        if len(y_true) != len(y_pred):
+            raise ValueError(f"Got {len(y_pred)} predictions for {len(y_true)} targets")
+        if self.task is None:
+            self.task = self.infer_task(y_true)
+
+        self.rows += len(y_true)
+        self.batch_seconds.append(seconds)
+        self.batch_rows.append(len(y_true))
+
+        if self.task == 'classification':
+            matches = y_true == y_pred
+            self.correct += int(matches.sum())
+            for label in np.union1d(np.unique(y_true), np.unique(y_pred)).tolist():
+                true_is, pred_is = y_true == label, y_pred == label
+                counts = np.array([np.sum(true_is & pred_is), np.sum(~true_is & pred_is), np.sum(true_is & ~pred_is)])
+                if label in self.class_counts:
+                    self.class_counts[label] += counts
+                else:
+                    self.class_counts[label] = counts
+        else:
+            y_true = y_true.astype(np.float64)
+            errors = y_pred.astype(np.float64) - y_true
+            self.abs_error += float(np.abs(errors).sum())
+            self.sq_error += float(np.dot(errors, errors))
+            self.target_sum += float(y_true.sum())
+            self.target_sq_sum += float(np.dot(y_true, y_true))
+
+    def merge(self, other: 'EvaluationMetrics') -> 'EvaluationMetrics':
+        if other.task is not None and self.task is not None and other.task != self.task:
+            raise ValueError(f"Cannot merge {other.task} metrics into {self.task} metrics")
+        self.task = self.task or other.task
+        self.rows += other.rows
+        self.correct += other.correct
+        for label, counts in other.class_counts.items():
+            if label in self.class_counts:
+                self.class_counts[label] = self.class_counts[label] + counts
+            else:
+                self.class_counts[label] = counts.copy()
+        self.abs_error += other.abs_error
+        self.sq_error += other.sq_error
+        self.target_sum += other.target_sum
+        self.target_sq_sum += other.target_sq_sum
+        self.batch_seconds.extend(other.batch_seconds)
+        self.batch_rows.extend(other.batch_rows)
+        return self
+
+    def result(self) -> Dict[str, Any]:
+        seconds = np.asarray(self.batch_seconds, dtype=np.float64)
+        rows = np.asarray(self.batch_rows, dtype=np.float64)
+        result: Dict[str, Any] = {'task': self.task, 'rows': self.rows, 'batches': len(seconds)}
+
+        if self.rows and self.task == 'classification':
+            result['accuracy'] = self.correct / self.rows
+            per_class = {}
+            for label, (tp, fp, fn) in self.class_counts.items():
+                precision = tp / (tp + fp) if tp + fp else 0.0
+                recall = tp / (tp + fn) if tp + fn else 0.0
+                per_class[label] = {'precision': float(precision), 'recall': float(recall), 'support': int(tp + fn)}
+            result['per_class'] = per_class
+            result['precision_macro'] = float(np.mean([c['precision'] for c in per_class.values()]))
+            result['recall_macro'] = float(np.mean([c['recall'] for c in per_class.values()]))
+        elif self.rows:
+            mean = self.target_sum / self.rows
+            total_variance = self.target_sq_sum - self.rows * mean * mean
+            result['mae'] = self.abs_error / self.rows
+            result['mse'] = self.sq_error / self.rows
+            result['rmse'] = float(np.sqrt(self.sq_error / self.rows))
+            result['r2'] = 1.0 - self.sq_error / total_variance if total_variance > 0 else 0.0
+
+        if len(seconds):
+            p50, p95, p99 = np.percentile(seconds, [50, 95, 99])
+            result['latency'] = {
+                'total_seconds': float(seconds.sum()),
+                'batch_p50': float(p50),
+                'batch_p95': float(p95),
+                'batch_p99': float(p99),
+                'batch_mean': float(seconds.mean()),
+                'per_row_mean': float(seconds.sum() / rows.sum()) if rows.sum() else 0.0,
+                'rows_per_second': float(rows.sum() / seconds.sum()) if seconds.sum() else 0.0
+            }
+        return result
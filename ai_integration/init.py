@@ -1,5 +1,11 @@
 from .connector_hub import ConnectorHub
 from .model_registry import ModelRegistry
 from .training_pipeline import TrainingPipeline
+from .batch_predictor import BatchingPredictor
+from .prediction_cache import PredictionCache
+from .model_store import ModelStore
+from .training_jobs import TrainingJobManager
+from .evaluation import EvaluationMetrics
 
-__all__ = ['ConnectorHub', 'ModelRegistry', 'TrainingPipeline']
\ No newline at end of file
+__all__ = ['ConnectorHub', 'ModelRegistry', 'TrainingPipeline', 'BatchingPredictor', 'PredictionCache', 'ModelStore',
+           'TrainingJobManager', 'EvaluationMetrics']
\ No newline at end of file
@@ -1,35 +1,93 @@
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, Callable, List
 
 class ModelRegistry:
-    def __init__(self):
+    def __init__(self, prediction_cache=None, model_store=None):
         self.logger = logging.getLogger(__name__)
         self.models: Dict[str, Any] = {}
+        self.model_store = model_store
+        self.model_versions: Dict[str, int] = {}
+        self.listeners: List[Callable[[str, str], None]] = []
+        self.prediction_cache = prediction_cache
+        if prediction_cache is not None:
+            prediction_cache.attach(self)
+
+    def add_listener(self, callback: Callable[[str, str], None]):
+        self.listeners.append(callback)
+
+    def _notify(self, event: str, name: str):
+        for callback in self.listeners:
+            try:
+                callback(event, name)
+            except Exception as e:
+                self.logger.error(f"Error in model registry listener: {str(e)}")
 
     def register_model(self, name: str, model: Any):
         self.logger.info(f"Registering model: {name}")
         self.models[name] = model
+        self.model_versions[name] = self.model_versions.get(name, 0) + 1
+        self._notify('register', name)
+
+    def register_model_artifact(self, name: str, path: str, loader=None):
+        if self.model_store is None:
+            raise ValueError("ModelRegistry has no model store for artifact-backed models")
+        self.logger.info(f"Registering model artifact: {name}")
+        self.models.pop(name, None)
+        self.model_store.register_artifact(name, path, loader)
+        self.model_versions[name] = self.model_versions.get(name, 0) + 1
+        self._notify('register', name)
+
+    def _has_model(self, name: str) -> bool:
+        return name in self.models or (self.model_store is not None and self.model_store.has_artifact(name))
 
     def unregister_model(self, name: str):
-        if name in self.models:
+        if self._has_model(name):
             self.logger.info(f"Unregistering model: {name}")
-            del self.models[name]
+            self.models.pop(name, None)
+            if self.model_store is not None:
+                self.model_store.unregister_artifact(name)
+            self.model_versions[name] = self.model_versions.get(name, 0) + 1
+            self._notify('unregister', name)
         else:
             self.logger.warning(f"Model {name} not found")
 
     def get_model(self, name: str) -> Any:
         if name in self.models:
             return self.models[name]
+        elif self.model_store is not None and self.model_store.has_artifact(name):
+            # Loaded on first use and reloaded transparently after an eviction
+            return self.model_store.get(name)
         else:
             self.logger.error(f"Model {name} not found")
             return None
 
+    def get_model_version(self, name: str) -> int:
+        return self.model_versions.get(name, 0)
+
     def list_models(self) -> list:
-        return list(self.models.keys())
+        names = list(self.models.keys())
+        if self.model_store is not None:
+            names.extend(name for name in self.model_store.list_artifacts() if name not in self.models)
+        return names
 
     def update_model(self, name: str, updated_model: Any):
-        if name in self.models:
+        if self._has_model(name):
             self.logger.info(f"Updating model: {name}")
             self.models[name] = updated_model
+            if self.model_store is not None:
+                # The in-memory model replaces the artifact, so the stale copy must not stay loaded in the budget
+                self.model_store.unregister_artifact(name)
+            self.model_versions[name] = self.model_versions.get(name, 0) + 1
+            self._notify('update', name)
         else:
-            self.logger.warning(f"Model {name} not found. Cannot update.")
\ No newline at end of file
+            self.logger.warning(f"Model {name} not found. Cannot update.")
+
+    def predict(self, name: str, data: Any) -> Any:
+        # Read the version before the model so a concurrent update can only file results under a stale version
+        version = self.get_model_version(name)
+        model = self.get_model(name)
+        if model is None:
+            raise ValueError(f"Model {name} not found")
+        if self.prediction_cache is None:
+            return model.predict(data)
+        return self.prediction_cache.get_or_compute(name, version, data, model.predict)
@@ -0,0 +1,134 @@
+import logging
+import os
+import pickle
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Callable, Dict, Optional
+
+
+def load_artifact(path: str) -> Any:
+    # Weight arrays are memory-mapped where the format allows it, so worker processes loading the
+    # same artifact share the page cache instead of each holding a private copy
+    suffix = os.path.splitext(path)[1].lower()
+    if suffix == '.npy':
+        import numpy as np
+        return np.load(path, mmap_mode='r')
+    if suffix == '.npz':
+        import numpy as np
+        return dict(np.load(path))
+    if suffix in ('.joblib', '.pkl', '.pickle'):
+        try:
+            import joblib
+        except ImportError:
+            with open(path, 'rb') as f:
+                return pickle.load(f)
+        # Arrays are only mappable when the artifact was dumped uncompressed
+        return joblib.load(path, mmap_mode='r')
+    raise ValueError(f"Unsupported model artifact format: {path}")
+
+
+class ModelArtifact:
+    def __init__(self, name: str, path: str, loader: Callable[[str], Any]):
+        self.name = name
+        self.path = path
+        self.loader = loader
+        self.model = None
+        self.size = 0
+        self.load_count = 0
+        self.lock = Lock()
+
+
+class ModelStore:
+    def __init__(self, memory_budget: int = 2 * 1024 ** 3):
+        self.logger = logging.getLogger(__name__)
+        self.memory_budget = memory_budget  # bytes
+        self.artifacts: Dict[str, ModelArtifact] = {}
+        self.loaded: OrderedDict = OrderedDict()  # name -> size, least recently used first
+        self.loaded_bytes = 0
+        self.lock = Lock()
+
+    def register_artifact(self, name: str, path: str, loader: Optional[Callable[[str], Any]] = None):
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"Model artifact not found: {path}")
+        self.logger.info(f"Registering model artifact: {name} -> {path}")
+        self.unregister_artifact(name)
+        with self.lock:
+            self.artifacts[name] = ModelArtifact(name, path, loader or load_artifact)
+
+    def unregister_artifact(self, name: str):
+        with self.lock:
+            artifact = self.artifacts.pop(name, None)
+            if artifact is not None:
+                self._drop(artifact)
+
+    def has_artifact(self, name: str) -> bool:
+        return name in self.artifacts
+
+    def list_artifacts(self) -> list:
+        return list(self.artifacts.keys())
+
+    def get(self, name: str) -> Any:
+        artifact = self.artifacts.get(name)
+        if artifact is None:
+            return None
+
+        with self.lock:
+            if artifact.model is not None:
+                self.loaded.move_to_end(name)
+                return artifact.model
+
+        # Load outside the store lock so other models stay available; the artifact lock stops two
+        # callers from loading the same model twice
+        with artifact.lock:
+            if artifact.model is None:
+                size = os.path.getsize(artifact.path)
+                with self.lock:
+                    self._make_room(size, keep=name)
+                self.logger.info(f"Loading model {name} from {artifact.path}")
+                model = artifact.loader(artifact.path)
+                with self.lock:
+                    artifact.load_count += 1
+                    # An unregister (or re-register) during the load must not leave an untracked name in
+                    # `loaded`, or _make_room would later look it up in `artifacts` and fail
+                    if self.artifacts.get(name) is not artifact:
+                        return model
+                    artifact.model, artifact.size = model, size
+                    self.loaded[name] = size
+                    self.loaded_bytes += size
+            with self.lock:
+                if name in self.loaded:
+                    self.loaded.move_to_end(name)
+            return artifact.model
+
+    def _make_room(self, size: int, keep: str):
+        while self.loaded and self.loaded_bytes + size > self.memory_budget:
+            victim = next(iter(self.loaded))
+            if victim == keep:
+                break
+            self.logger.info(f"Evicting model {victim} to stay within the memory budget")
+            artifact = self.artifacts.get(victim)
+            if artifact is None:
+                self.loaded_bytes -= self.loaded.pop(victim)
+                continue
+            self._drop(artifact)
+
+    def _drop(self, artifact: ModelArtifact):
+        if artifact.name in self.loaded:
+            self.loaded_bytes -= self.loaded.pop(artifact.name)
+        artifact.model = None
+        artifact.size = 0
+
+    def evict(self, name: str):
+        with self.lock:
+            artifact = self.artifacts.get(name)
+            if artifact is not None:
+                self._drop(artifact)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            'artifacts': len(self.artifacts),
+            'loaded': list(self.loaded.keys()),
+            'loaded_bytes': self.loaded_bytes,
+            'memory_budget': self.memory_budget,
+            'loads': {name: artifact.load_count for name, artifact in self.artifacts.items()}
+        }
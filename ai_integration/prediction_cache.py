@@ -0,0 +1,155 @@
+import hashlib
+import json
+import logging
+import pickle
+import sys
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Callable, Dict, Optional, Tuple
+
+
+class PredictionCache:
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024, ttl: Optional[float] = None):
+        self.logger = logging.getLogger(__name__)
+        self.max_bytes = max_bytes
+        self.ttl = ttl  # seconds; None keeps entries until evicted or invalidated
+        self.entries: OrderedDict = OrderedDict()  # key -> (value, size, expires_at)
+        self.model_keys: Dict[str, set] = {}
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.lock = Lock()
+
+    @staticmethod
+    def fingerprint(data: Any) -> str:
+        digest = hashlib.blake2b(digest_size=16)
+        np = sys.modules.get('numpy')
+        pd = sys.modules.get('pandas')
+        if np is not None and isinstance(data, np.ndarray) and data.dtype.hasobject:
+            # The buffer of an object array holds PyObject pointers, not values, so hash the contents
+            # (pd.util.hash_array is not used: it stringifies mixed objects, so 1 and '1' would collide)
+            digest.update(f"ndarray:{data.dtype.str}:{data.shape}".encode())
+            values = data.tolist()
+            try:
+                digest.update(b"json:" + json.dumps(values, separators=(',', ':')).encode('utf-8'))
+            except (TypeError, ValueError):
+                digest.update(b"pickle:" + pickle.dumps(values))
+        elif np is not None and isinstance(data, np.ndarray):
+            digest.update(f"ndarray:{data.dtype.str}:{data.shape}".encode())
+            digest.update(np.ascontiguousarray(data).data)
+        elif pd is not None and isinstance(data, pd.DataFrame):
+            digest.update(f"dataframe:{list(data.columns)}".encode())
+            digest.update(pd.util.hash_pandas_object(data, index=True).values.tobytes())
+        elif pd is not None and isinstance(data, pd.Series):
+            digest.update(f"series:{data.name}".encode())
+            digest.update(pd.util.hash_pandas_object(data, index=True).values.tobytes())
+        elif isinstance(data, (bytes, bytearray)):
+            digest.update(b"bytes:" + bytes(data))
+        elif isinstance(data, str):
+            digest.update(b"str:" + data.encode('utf-8'))
+        else:
+            try:
+                digest.update(b"json:" + json.dumps(data, sort_keys=True, separators=(',', ':')).encode('utf-8'))
+            except (TypeError, ValueError):
+                digest.update(b"pickle:" + pickle.dumps(data))
+        return digest.hexdigest()
+
+    @classmethod
+    def _estimate_size(cls, value: Any) -> int:
+        # getsizeof is shallow, so containers and object arrays are walked and their contents charged too
+        np = sys.modules.get('numpy')
+        pd = sys.modules.get('pandas')
+        if pd is not None and isinstance(value, (pd.DataFrame, pd.Series)):
+            return int(np.sum(value.memory_usage(index=True, deep=True)))
+        if np is not None and isinstance(value, np.ndarray):
+            if value.dtype.hasobject:
+                return value.nbytes + sum(cls._estimate_size(item) for item in value.ravel().tolist())
+            return value.nbytes
+        if isinstance(value, dict):
+            return sys.getsizeof(value) + sum(cls._estimate_size(k) + cls._estimate_size(v) for k, v in value.items())
+        if isinstance(value, (list, tuple, set, frozenset)):
+            return sys.getsizeof(value) + sum(cls._estimate_size(item) for item in value)
+        nbytes = getattr(value, 'nbytes', None)
+        if isinstance(nbytes, int):
+            return nbytes
+        return sys.getsizeof(value)
+
+    def get(self, model_name: str, version: int, data_key: str) -> Tuple[bool, Any]:
+        key = (model_name, version, data_key)
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None or (entry[2] is not None and time.monotonic() >= entry[2]):
+                if entry is not None:
+                    self._remove(key)
+                self.misses += 1
+                return False, None
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return True, entry[0]
+
+    def put(self, model_name: str, version: int, data_key: str, value: Any):
+        key = (model_name, version, data_key)
+        size = self._estimate_size(value)
+        if size > self.max_bytes:
+            return
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else None
+        with self.lock:
+            if key in self.entries:
+                self._remove(key)
+            self.entries[key] = (value, size, expires_at)
+            self.model_keys.setdefault(model_name, set()).add(key)
+            self.current_bytes += size
+            while self.current_bytes > self.max_bytes:
+                self._remove(next(iter(self.entries)))
+                self.evictions += 1
+
+    def get_or_compute(self, model_name: str, version: int, data: Any, compute: Callable[[Any], Any]) -> Any:
+        data_key = self.fingerprint(data)
+        hit, value = self.get(model_name, version, data_key)
+        if hit:
+            return value
+        value = compute(data)
+        self.put(model_name, version, data_key, value)
+        return value
+
+    def _remove(self, key):
+        _, size, _ = self.entries.pop(key)
+        self.current_bytes -= size
+        keys = self.model_keys.get(key[0])
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self.model_keys[key[0]]
+
+    def invalidate_model(self, model_name: str):
+        with self.lock:
+            for key in list(self.model_keys.get(model_name, ())):
+                self._remove(key)
+        self.logger.info(f"Invalidated cached predictions for model: {model_name}")
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.model_keys.clear()
+            self.current_bytes = 0
+
+    def attach(self, model_registry):
+        model_registry.add_listener(self._on_model_event)
+
+    def _on_model_event(self, event: str, model_name: str):
+        if event in ('update', 'unregister', 'register'):
+            self.invalidate_model(model_name)
+
+    def get_stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'evictions': self.evictions,
+            'entries': len(self.entries),
+            'bytes': self.current_bytes,
+            'max_bytes': self.max_bytes
+        }
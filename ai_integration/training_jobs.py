@@ -0,0 +1,192 @@
+import copy
+import itertools
+import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from threading import Event, Lock
+from typing import Any, Callable, Dict, List, Optional
+
+
+def _split_dataset(dataset: Any, config: Dict[str, Any]):
+    if isinstance(dataset, tuple):
+        return dataset
+    target_column = config.get('target_column')
+    if target_column is None:
+        raise ValueError("Training on a DataFrame requires 'target_column' in the config")
+    feature_columns = config.get('feature_columns')
+    features = dataset[feature_columns] if feature_columns else dataset.drop(columns=[target_column])
+    return features.to_numpy(), dataset[target_column].to_numpy()
+
+
+def run_training_job(model: Any, config: Dict[str, Any], dataset: Any, validation_data: Any = None):
+    # Runs inside a worker process, so it only touches its arguments and returns the trained copy
+    started = time.perf_counter()
+    if config.get('params'):
+        model.set_params(**config['params'])
+    x, y = _split_dataset(dataset, config)
+
+    if config.get('incremental') and hasattr(model, 'partial_fit'):
+        batch_size = config.get('batch_size', 32)
+        fit_kwargs = {'classes': config['classes']} if 'classes' in config else {}
+        for _ in range(config.get('epochs', 1)):
+            for start in range(0, len(x), batch_size):
+                model.partial_fit(x[start:start + batch_size], y[start:start + batch_size], **fit_kwargs)
+    else:
+        model.fit(x, y)
+
+    metrics = {'train_seconds': time.perf_counter() - started, 'rows': len(x), 'pid': os.getpid()}
+    if validation_data is not None and hasattr(model, 'score'):
+        val_x, val_y = _split_dataset(validation_data, config)
+        metrics['score'] = float(model.score(val_x, val_y))
+    return model, metrics
+
+
+class TrainingJob:
+    def __init__(self, job_id: int, model_name: str, config: Dict[str, Any], write_back: bool):
+        self.job_id = job_id
+        self.model_name = model_name
+        self.config = config
+        self.write_back = write_back
+        self.future = None
+        self.submitted_at = time.time()
+        self.finished_at = None
+        self.model = None
+        self.metrics = None
+        self.error = None
+        self.settled = Event()  # set once results and callbacks have been handled
+
+    @property
+    def status(self) -> str:
+        if self.error is not None:
+            return 'failed'
+        if self.finished_at is not None:
+            return 'completed'
+        if self.future is not None and self.future.running():
+            return 'running'
+        return 'pending'
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            'job_id': self.job_id,
+            'model_name': self.model_name,
+            'status': self.status,
+            'config': self.config,
+            'submitted_at': self.submitted_at,
+            'finished_at': self.finished_at,
+            'metrics': self.metrics,
+            'error': self.error
+        }
+
+
+class TrainingJobManager:
+    def __init__(self, training_pipeline, max_workers: int = None):
+        self.logger = logging.getLogger(__name__)
+        self.training_pipeline = training_pipeline
+        self.model_registry = training_pipeline.model_registry
+        if max_workers is None:
+            max_workers = len(os.sched_getaffinity(0)) if hasattr(os, 'sched_getaffinity') else os.cpu_count()
+        self.max_workers = max_workers or 1
+        self.executor = None
+        self.jobs: Dict[int, TrainingJob] = {}
+        self.job_ids = itertools.count(1)
+        self.lock = Lock()
+
+    def _get_executor(self):
+        if self.executor is None:
+            self.executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            self.logger.info(f"Started training process pool with {self.max_workers} workers")
+        return self.executor
+
+    def submit(self, model_name: str, dataset: Any, config: Dict[str, Any] = None, validation_data: Any = None,
+               write_back: bool = True, on_complete: Optional[Callable[[Dict[str, Any]], None]] = None) -> int:
+        model = self.model_registry.get_model(model_name)
+        if model is None:
+            raise ValueError(f"Model {model_name} not found in registry")
+        if config is None:
+            config = self.training_pipeline.training_configs.get(model_name)
+            if config is None:
+                raise ValueError(f"No training config found for model: {model_name}")
+
+        job = TrainingJob(next(self.job_ids), model_name, config, write_back)
+        with self.lock:
+            self.jobs[job.job_id] = job
+        # The registry's model is pickled into the worker, so every job trains its own copy
+        job.future = self._get_executor().submit(run_training_job, model, config, dataset, validation_data)
+        job.future.add_done_callback(lambda future: self._on_done(job, future, on_complete))
+        self.logger.info(f"Submitted training job {job.job_id} for model {model_name}")
+        return job.job_id
+
+    def _on_done(self, job: TrainingJob, future, on_complete):
+        try:
+            job.model, job.metrics = future.result()
+            self.logger.info(f"Training job {job.job_id} for model {job.model_name} completed: {job.metrics}")
+            if job.write_back:
+                self.model_registry.update_model(job.model_name, job.model)
+        except Exception as e:
+            job.error = str(e)
+            self.logger.error(f"Training job {job.job_id} for model {job.model_name} failed: {str(e)}")
+        finally:
+            job.finished_at = time.time()
+        if on_complete is not None:
+            try:
+                on_complete(job.as_dict())
+            except Exception as e:
+                self.logger.error(f"Error in training job callback: {str(e)}")
+        job.settled.set()
+
+    def submit_sweep(self, model_name: str, dataset: Any, param_grid: List[Dict[str, Any]], validation_data: Any,
+                     base_config: Dict[str, Any] = None, write_back: bool = True,
+                     on_complete: Optional[Callable[[Dict[str, Any]], None]] = None) -> List[int]:
+        # Every parameter set trains in parallel; once all finish, the best-scoring model is written back
+        if not param_grid:
+            raise ValueError("Parameter grid for a sweep must not be empty")
+        if base_config is None:
+            base_config = self.training_pipeline.training_configs.get(model_name, {})
+        finished: List[TrainingJob] = []
+        sweep_lock = Lock()
+
+        def job_done(result):
+            if on_complete is not None:
+                on_complete(result)
+            with sweep_lock:
+                finished.append(self.jobs[result['job_id']])
+                if len(finished) < len(param_grid):
+                    return
+            scored = [job for job in finished if job.metrics and 'score' in job.metrics]
+            if not scored:
+                self.logger.error(f"Sweep for model {model_name} produced no scored models")
+                return
+            best = max(scored, key=lambda job: job.metrics['score'])
+            self.logger.info(f"Best sweep result for model {model_name}: job {best.job_id} "
+                             f"with score {best.metrics['score']:.4f} and params {best.config.get('params')}")
+            if write_back:
+                self.model_registry.update_model(model_name, best.model)
+
+        job_ids = []
+        for params in param_grid:
+            config = copy.deepcopy(base_config)
+            config['params'] = {**config.get('params', {}), **params}
+            job_ids.append(self.submit(model_name, dataset, config, validation_data,
+                                       write_back=False, on_complete=job_done))
+        return job_ids
+
+    def get_job(self, job_id: int) -> Optional[Dict[str, Any]]:
+        job = self.jobs.get(job_id)
+        return job.as_dict() if job else None
+
+    def list_jobs(self) -> List[Dict[str, Any]]:
+        return [job.as_dict() for job in self.jobs.values()]
+
+    def wait(self, job_ids: List[int] = None, timeout: float = None) -> List[Dict[str, Any]]:
+        jobs = [self.jobs[job_id] for job_id in job_ids] if job_ids is not None else list(self.jobs.values())
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        for job in jobs:
+            # Waiting on settled rather than the future also covers the registry write-back
+            job.settled.wait(None if deadline is None else max(0.0, deadline - time.monotonic()))
+        return [job.as_dict() for job in jobs]
+
+    def shutdown(self, wait: bool = True):
+        if self.executor is not None:
+            self.executor.shutdown(wait=wait, cancel_futures=not wait)
+            self.executor = None
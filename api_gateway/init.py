@@ -1,5 +1,8 @@
 from api_gateway.router import APIRouter
 from api_gateway.version_manager import VersionManager
-from api_gateway.rate_limiter import RateLimiter
+from api_gateway.rate_limiter import RateLimiter, KeyedRateLimiter
+from api_gateway.task_executor import TaskExecutor, ExecutorSaturatedError
+from api_gateway.shared_state import SharedRateLimiter, SharedRevocationList
 
-__all__ = ['APIRouter', 'VersionManager', 'RateLimiter']
\ No newline at end of file
+__all__ = ['APIRouter', 'VersionManager', 'RateLimiter', 'KeyedRateLimiter', 'TaskExecutor', 'ExecutorSaturatedError',
+           'SharedRateLimiter', 'SharedRevocationList']
\ No newline at end of file
@@ -1,5 +1,6 @@
 import time
-from collections import deque
+from collections import deque, OrderedDict
+from threading import Lock
 
 class RateLimiter:
     def __init__(self, max_requests, time_window):
@@ -19,4 +20,59 @@ class RateLimiter:
             self.request_times.append(current_time)
             return True
 
-        return False
\ No newline at end of file
+        return False
+
+
+class KeyedRateLimiter:
+    # Sliding-window counter: every key keeps only [window_start, previous_count, current_count, last_seen],
+    # and the previous window is weighted by how much of it still overlaps the sliding window.
+    def __init__(self, max_requests, time_window, max_keys=100000):
+        self.max_requests = max_requests
+        self.time_window = time_window
+        self.max_keys = max_keys
+        self.windows = OrderedDict()
+        self.lock = Lock()
+
+    def allow_request(self, key):
+        current_time = time.monotonic()
+        with self.lock:
+            window = self.windows.get(key)
+            if window is None:
+                window = [current_time, 0, 0, current_time]
+                self.windows[key] = window
+                if len(self.windows) > self.max_keys:
+                    self.windows.popitem(last=False)
+            else:
+                window[3] = current_time
+                self.windows.move_to_end(key)
+            self._evict_idle(current_time)
+
+            elapsed = current_time - window[0]
+            if elapsed >= self.time_window:
+                windows_passed = int(elapsed // self.time_window)
+                window[1] = window[2] if windows_passed == 1 else 0
+                window[2] = 0
+                window[0] += windows_passed * self.time_window
+                elapsed = current_time - window[0]
+
+            previous_weight = (self.time_window - elapsed) / self.time_window
+            if window[1] * previous_weight + window[2] < self.max_requests:
+                window[2] += 1
+                return True
+
+            return False
+
+    def _evict_idle(self, current_time):
+        # Keys are kept in last-seen order, so only the oldest entry needs checking. A key idle for two
+        # full windows has no requests left to count and can be dropped without changing any decision.
+        if self.windows:
+            oldest_key, oldest = next(iter(self.windows.items()))
+            if current_time - oldest[3] > 2 * self.time_window:
+                del self.windows[oldest_key]
+
+    def reset(self, key):
+        with self.lock:
+            self.windows.pop(key, None)
+
+    def get_key_count(self):
+        return len(self.windows)
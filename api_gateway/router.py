@@ -1,26 +1,71 @@
+import asyncio
+import json
 import logging
-from fastapi import FastAPI, HTTPException, Depends
+import multiprocessing
+import signal
+import socket
+import sys
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, HTTPException, Depends, Request
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 from fastapi.security import OAuth2PasswordBearer
 from pydantic import BaseModel
-from typing import Dict, Any
+from typing import Dict, Any, List
 from .version_manager import VersionManager
-from .rate_limiter import RateLimiter
+from .rate_limiter import KeyedRateLimiter
+from .shared_state import SharedRateLimiter, SharedRevocationList
+from .task_executor import TaskExecutor, ExecutorSaturatedError
+from core.command_dispatcher import CommandError
 from security.authentication import Authentication
 from security.access_control import AccessControl, Permission
 
 class APIRouter:
-    def __init__(self, kernel, auth: Authentication, access_control: AccessControl):
-        self.app = FastAPI()
+    def __init__(self, kernel, auth: Authentication, access_control: AccessControl,
+                 max_batch_size: int = 10000, batch_concurrency: int = 32,
+                 max_in_flight: int = None, max_queue_depth: int = 100):
+        self.app = FastAPI(lifespan=self.lifespan)
         self.kernel = kernel
         self.auth = auth
         self.access_control = access_control
         self.version_manager = VersionManager()
-        self.rate_limiter = RateLimiter(max_requests=100, time_window=60)
+        self.rate_limiter = KeyedRateLimiter(max_requests=100, time_window=60)
+        self.max_batch_size = max_batch_size
+        self.batch_concurrency = batch_concurrency
+        self.executor = TaskExecutor(max_in_flight=max_in_flight,
+                                     max_queue_depth=max_queue_depth)
         self.logger = logging.getLogger(__name__)
         self.oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
 
         self.setup_routes()
 
+    @asynccontextmanager
+    async def lifespan(self, app: FastAPI):
+        yield
+        self.executor.shutdown(wait=False)
+
+    def authorize(self, token: str, permission: Permission):
+        # Tokens are verified before rate limiting (cheap with the verification cache) so garbage tokens
+        # cannot flood the limiter, and the quota follows the user rather than whichever token they hold
+        user_id = self.auth.get_user_id_from_token(token)
+        if not user_id:
+            raise HTTPException(status_code=401, detail="Invalid token")
+
+        if not self.rate_limiter.allow_request(str(user_id)):
+            raise HTTPException(status_code=429, detail="Rate limit exceeded")
+
+        if not self.access_control.check_permission(user_id, permission):
+            raise HTTPException(status_code=403, detail="Permission denied")
+
+        return user_id
+
+    async def run_task(self, task: Dict[str, Any]):
+        try:
+            return await self.executor.run(self.kernel.process_command, task)
+        except ExecutorSaturatedError as e:
+            self.logger.warning(f"Rejecting task, executor saturated (queue depth {e.queue_depth})")
+            raise HTTPException(status_code=503, detail="Server busy, retry later",
+                                headers={"Retry-After": str(e.retry_after)})
+
     def setup_routes(self):
         @self.app.post("/token")
         async def login(username: str, password: str):
@@ -31,53 +76,58 @@ class APIRouter:
 
         @self.app.post("/execute_task")
         async def execute_task(task: Dict[str, Any], token: str = Depends(self.oauth2_scheme)):
-            if not self.rate_limiter.allow_request():
-                raise HTTPException(status_code=429, detail="Rate limit exceeded")
-
-            user_id = self.auth.get_user_id_from_token(token)
-            if not user_id:
-                raise HTTPException(status_code=401, detail="Invalid token")
-
-            if not self.access_control.check_permission(user_id, Permission.EXECUTE):
-                raise HTTPException(status_code=403, detail="Permission denied")
+            self.authorize(token, Permission.EXECUTE)
 
             try:
-                result = self.kernel.process_command(task)
+                result = await self.run_task(task)
                 return {"result": result}
+            except HTTPException:
+                raise
+            except CommandError as e:
+                raise HTTPException(status_code=400, detail=str(e))
             except Exception as e:
                 self.logger.error(f"Error executing task: {str(e)}")
                 raise HTTPException(status_code=500, detail="Internal server error")
 
-        @self.app.get("/system_status")
-        async def system_status(token: str = Depends(self.oauth2_scheme)):
-            if not self.rate_limiter.allow_request():
-                raise HTTPException(status_code=429, detail="Rate limit exceeded")
+        @self.app.post("/execute_batch")
+        async def execute_batch(request: Request, token: str = Depends(self.oauth2_scheme)):
+            self.authorize(token, Permission.EXECUTE)
+
+            tasks = await self._read_batch(request)
+            self.logger.info(f"Executing batch of {len(tasks)} tasks")
+            return StreamingResponse(self._stream_batch(tasks), media_type="application/x-ndjson")
 
-            user_id = self.auth.get_user_id_from_token(token)
-            if not user_id:
-                raise HTTPException(status_code=401, detail="Invalid token")
+        @self.app.get("/executor_metrics")
+        async def executor_metrics(token: str = Depends(self.oauth2_scheme)):
+            self.authorize(token, Permission.READ)
+            return self.executor.get_metrics()
 
-            if not self.access_control.check_permission(user_id, Permission.READ):
-                raise HTTPException(status_code=403, detail="Permission denied")
+        @self.app.get("/command_metrics")
+        async def command_metrics(token: str = Depends(self.oauth2_scheme)):
+            self.authorize(token, Permission.READ)
+            return self.kernel.dispatcher.get_metrics()
+
+        @self.app.get("/system_status")
+        async def system_status(request: Request, token: str = Depends(self.oauth2_scheme)):
+            self.authorize(token, Permission.READ)
 
             try:
-                status = self.kernel.resource_manager.check_resources()
-                return status
+                cached = self.kernel.status_cache.peek()
+                if cached is None:
+                    cached = await asyncio.to_thread(self.kernel.status_cache.get)
+                status, etag = cached
             except Exception as e:
                 self.logger.error(f"Error getting system status: {str(e)}")
                 raise HTTPException(status_code=500, detail="Internal server error")
 
+            headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+            if request.headers.get("if-none-match") == etag:
+                return Response(status_code=304, headers=headers)
+            return JSONResponse(status, headers=headers)
+
         @self.app.post("/update_config")
         async def update_config(config: Dict[str, Any], token: str = Depends(self.oauth2_scheme)):
-            if not self.rate_limiter.allow_request():
-                raise HTTPException(status_code=429, detail="Rate limit exceeded")
-
-            user_id = self.auth.get_user_id_from_token(token)
-            if not user_id:
-                raise HTTPException(status_code=401, detail="Invalid token")
-
-            if not self.access_control.check_permission(user_id, Permission.ADMIN):
-                raise HTTPException(status_code=403, detail="Permission denied")
+            self.authorize(token, Permission.ADMIN)
 
             try:
                 self.kernel.update_config(config)
@@ -86,6 +136,93 @@ class APIRouter:
                 self.logger.error(f"Error updating configuration: {str(e)}")
                 raise HTTPException(status_code=500, detail="Internal server error")
 
-    def run(self, host="0.0.0.0", port=8000):
+    async def _read_batch(self, request: Request) -> List[Dict[str, Any]]:
+        body = await request.body()
+        try:
+            if request.headers.get("content-type", "").startswith("application/x-ndjson"):
+                tasks = [json.loads(line) for line in body.splitlines() if line.strip()]
+            else:
+                tasks = json.loads(body)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Malformed batch body")
+
+        if not isinstance(tasks, list) or not all(isinstance(task, dict) for task in tasks):
+            raise HTTPException(status_code=400, detail="Batch must be a list of task objects")
+        if len(tasks) > self.max_batch_size:
+            raise HTTPException(status_code=413, detail=f"Batch exceeds {self.max_batch_size} tasks")
+        return tasks
+
+    async def _stream_batch(self, tasks: List[Dict[str, Any]]):
+        semaphore = asyncio.Semaphore(self.batch_concurrency)
+
+        async def run(index, task):
+            async with semaphore:
+                try:
+                    result = await self.executor.run(self.kernel.process_command, task)
+                    return {"index": index, "result": result}
+                except ExecutorSaturatedError:
+                    return {"index": index, "error": "Server busy, retry later"}
+                except Exception as e:
+                    self.logger.error(f"Error executing batch task {index}: {str(e)}")
+                    return {"index": index, "error": str(e)}
+
+        pending = [asyncio.ensure_future(run(index, task)) for index, task in enumerate(tasks)]
+        try:
+            for completed in asyncio.as_completed(pending):
+                line = await completed
+                yield json.dumps(line, default=str) + "\n"
+        finally:
+            for future in pending:
+                future.cancel()
+
+    def enable_shared_state(self):
+        # Swap per-process limiter and revocation state for shared-memory versions; must run before forking
+        self.rate_limiter = SharedRateLimiter(max_requests=self.rate_limiter.max_requests,
+                                              time_window=self.rate_limiter.time_window)
+        self.auth.revoked_tokens = SharedRevocationList()
+        self.logger.info("Using shared-memory rate limit and token revocation state")
+
+    def run(self, host="0.0.0.0", port=8000, workers=1):
+        import uvicorn
+        if workers <= 1:
+            uvicorn.run(self.app, host=host, port=port)
+            return
+
+        self.enable_shared_state()
+        # IPPROTO_TCP must be explicit: asyncio only sets TCP_NODELAY on accepted sockets whose proto says TCP
+        sock = socket.socket(socket.AF_INET6 if ':' in host else socket.AF_INET, socket.SOCK_STREAM, socket.IPPROTO_TCP)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        sock.bind((host, port))
+        sock.listen(2048)
+        sock.set_inheritable(True)
+
+        context = multiprocessing.get_context('fork')
+        processes = [context.Process(target=self._serve_worker, args=(sock, host, port))
+                     for _ in range(workers)]
+        for process in processes:
+            process.start()
+        signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+        self.logger.info(f"Started {workers} gateway workers on {host}:{port}")
+
+        try:
+            for process in processes:
+                process.join()
+        except KeyboardInterrupt:
+            self.logger.info("Stopping gateway workers")
+        finally:
+            for process in processes:
+                if process.is_alive():
+                    process.terminate()
+                    process.join()
+            sock.close()
+
+    def _serve_worker(self, sock, host, port):
         import uvicorn
-        uvicorn.run(self.app, host=host, port=port)
\ No newline at end of file
+        server = uvicorn.Server(uvicorn.Config(self.app, host=host, port=port))
+        try:
+            server.run(sockets=[sock])
+        finally:
+            # Forked workers leave through os._exit, which skips atexit, so pending config writes go out here
+            config = getattr(self.kernel, 'dynamic_config', None)
+            if config is not None:
+                config.flush()
@@ -0,0 +1,121 @@
+import hashlib
+import logging
+import mmap
+import multiprocessing
+import struct
+import time
+
+
+def _key_hash(key) -> int:
+    if not isinstance(key, bytes):
+        key = str(key).encode('utf-8')
+    # Zero marks an empty slot, so keys never hash to it
+    return int.from_bytes(hashlib.blake2b(key, digest_size=8).digest(), 'little') or 1
+
+
+class SharedSlotTable:
+    # Fixed-size open-addressing table in an anonymous shared mmap. Worker processes forked after
+    # construction see the same pages. The table is split into regions, each with its own lock,
+    # and a key only ever probes inside its home region so one lock covers every slot it can touch.
+    def __init__(self, slot_format: str, slots: int, regions: int = 64, max_probes: int = 8):
+        self.logger = logging.getLogger(__name__)
+        self.slot = struct.Struct(slot_format)
+        self.regions = regions
+        self.region_size = max(1, slots // regions)
+        self.slots = self.region_size * regions
+        self.max_probes = min(max_probes, self.region_size)
+        self.buffer = mmap.mmap(-1, self.slots * self.slot.size)
+        self.locks = [multiprocessing.Lock() for _ in range(regions)]
+
+    def _region(self, key_hash):
+        region = key_hash % self.regions
+        return region, region * self.region_size, (key_hash // self.regions) % self.region_size
+
+    def _probe(self, key_hash):
+        region, base, start = self._region(key_hash)
+        for probe in range(self.max_probes):
+            offset = (base + (start + probe) % self.region_size) * self.slot.size
+            yield offset, self.slot.unpack_from(self.buffer, offset)
+
+    def _lock(self, key_hash):
+        return self.locks[key_hash % self.regions]
+
+    def _write(self, offset, *values):
+        self.slot.pack_into(self.buffer, offset, *values)
+
+
+class SharedRateLimiter(SharedSlotTable):
+    # Same sliding-window counter as KeyedRateLimiter, with the per-key state packed into
+    # (key_hash, window_start, previous_count, current_count, last_seen)
+    def __init__(self, max_requests, time_window, slots: int = 65536):
+        super().__init__('<QdIId', slots)
+        self.max_requests = max_requests
+        self.time_window = time_window
+
+    def allow_request(self, key):
+        key_hash = _key_hash(key)
+        current_time = time.monotonic()
+        with self._lock(key_hash):
+            offset, window = self._find_slot(key_hash, current_time)
+            _, window_start, previous_count, current_count, _ = window
+
+            elapsed = current_time - window_start
+            if elapsed >= self.time_window:
+                windows_passed = int(elapsed // self.time_window)
+                previous_count = current_count if windows_passed == 1 else 0
+                current_count = 0
+                window_start += windows_passed * self.time_window
+                elapsed = current_time - window_start
+
+            previous_weight = (self.time_window - elapsed) / self.time_window
+            allowed = previous_count * previous_weight + current_count < self.max_requests
+            if allowed:
+                current_count += 1
+            self._write(offset, key_hash, window_start, previous_count, current_count, current_time)
+            return allowed
+
+    def _find_slot(self, key_hash, current_time):
+        free = None
+        victim = None
+        for offset, entry in self._probe(key_hash):
+            if entry[0] == key_hash:
+                return offset, entry
+            # Empty slots and keys idle for two windows can be reused without changing any decision
+            if free is None and (entry[0] == 0 or current_time - entry[4] > 2 * self.time_window):
+                free = offset
+            if victim is None or entry[4] < victim[1]:
+                victim = (offset, entry[4])
+        return free if free is not None else victim[0], (key_hash, current_time, 0, 0, current_time)
+
+
+class SharedRevocationList(SharedSlotTable):
+    # Same interface as security.authentication.TokenRevocationList; slots hold (digest_hash, expires_at)
+    def __init__(self, slots: int = 16384):
+        super().__init__('<Qd', slots)
+
+    def revoke(self, digest, expires_at):
+        key_hash = _key_hash(digest)
+        now = time.time()
+        with self._lock(key_hash):
+            free = None
+            victim = None
+            for offset, (slot_hash, slot_expires) in self._probe(key_hash):
+                if slot_hash == key_hash:
+                    self._write(offset, key_hash, expires_at)
+                    return
+                if free is None and (slot_hash == 0 or slot_expires <= now):
+                    free = offset
+                if victim is None or slot_expires < victim[1]:
+                    victim = (offset, slot_expires)
+            if free is None:
+                self.logger.warning("Revocation table region full, dropping the revocation closest to expiry")
+                free = victim[0]
+            self._write(free, key_hash, expires_at)
+
+    def is_revoked(self, digest):
+        key_hash = _key_hash(digest)
+        with self._lock(key_hash):
+            for _, (slot_hash, slot_expires) in self._probe(key_hash):
+                if slot_hash == key_hash:
+                    return time.time() < slot_expires
+        return False
@@ -0,0 +1,82 @@
+import asyncio
+import functools
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+
+class ExecutorSaturatedError(Exception):
+    def __init__(self, queue_depth, retry_after):
+        super().__init__(f"Task backlog of {queue_depth} exceeds the queue limit")
+        self.queue_depth = queue_depth
+        self.retry_after = retry_after
+
+
+class TaskExecutor:
+    # Tasks run on threads against the live kernel. A process pool would have to pickle the kernel
+    # (which holds locks) and would run every task against a throwaway copy; CPU-bound commands belong
+    # in the dispatcher's 'cpu' mode instead
+    def __init__(self, max_in_flight: int = None, max_queue_depth: int = 100, retry_after: int = 1):
+        self.logger = logging.getLogger(__name__)
+        self.max_in_flight = max_in_flight or min(32, (os.cpu_count() or 1) + 4)
+        self.max_queue_depth = max_queue_depth
+        self.retry_after = retry_after
+        self.pool = None
+        self.semaphore = asyncio.Semaphore(self.max_in_flight)
+
+        self.queue_depth = 0
+        self.in_flight = 0
+        self.completed = 0
+        self.rejected = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def _get_pool(self):
+        if self.pool is None:
+            self.pool = ThreadPoolExecutor(max_workers=self.max_in_flight, thread_name_prefix="gateway-task")
+            self.logger.info(f"Started task pool with {self.max_in_flight} workers")
+        return self.pool
+
+    async def run(self, func, *args, **kwargs):
+        if self.queue_depth >= self.max_queue_depth:
+            self.rejected += 1
+            raise ExecutorSaturatedError(self.queue_depth, self.retry_after)
+
+        enqueued_at = time.perf_counter()
+        self.queue_depth += 1
+        try:
+            await self.semaphore.acquire()
+        finally:
+            self.queue_depth -= 1
+
+        wait_time = time.perf_counter() - enqueued_at
+        self.total_wait += wait_time
+        self.max_wait = max(self.max_wait, wait_time)
+        self.in_flight += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._get_pool(), functools.partial(func, *args, **kwargs))
+        finally:
+            self.in_flight -= 1
+            self.completed += 1
+            self.semaphore.release()
+
+    def get_metrics(self):
+        started = self.completed + self.in_flight
+        return {
+            'queue_depth': self.queue_depth,
+            'in_flight': self.in_flight,
+            'max_in_flight': self.max_in_flight,
+            'max_queue_depth': self.max_queue_depth,
+            'completed': self.completed,
+            'rejected': self.rejected,
+            'avg_wait_ms': (self.total_wait / started * 1000) if started else 0.0,
+            'max_wait_ms': self.max_wait * 1000
+        }
+
+    def shutdown(self, wait=True):
+        if self.pool is not None:
+            self.logger.info("Shutting down task pool")
+            self.pool.shutdown(wait=wait)
+            self.pool = None
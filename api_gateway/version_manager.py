@@ -1,3 +1,4 @@
+import bisect
 import logging
 from packaging import version
 
@@ -5,17 +6,37 @@ class VersionManager:
     def __init__(self):
         self.versions = {}
         self.logger = logging.getLogger(__name__)
+        # Sorted parsed versions with their original keys in matching order, plus a memo of resolved requests
+        self.parsed_versions = []
+        self.version_keys = []
+        self.resolved = {}
+        self.max_resolved = 4096
 
     def add_version(self, api_version, implementation):
+        if api_version not in self.versions:
+            parsed = version.parse(api_version)
+            index = bisect.bisect_left(self.parsed_versions, parsed)
+            self.parsed_versions.insert(index, parsed)
+            self.version_keys.insert(index, api_version)
+            self.resolved.clear()
         self.versions[api_version] = implementation
         self.logger.info(f"Added API version: {api_version}")
 
+    def resolve_version(self, requested_version):
+        try:
+            return self.resolved[requested_version]
+        except KeyError:
+            pass
+
+        index = bisect.bisect_right(self.parsed_versions, version.parse(requested_version))
+        compatible_version = self.version_keys[index - 1] if index else None
+        if len(self.resolved) >= self.max_resolved:
+            self.resolved.clear()
+        self.resolved[requested_version] = compatible_version
+        return compatible_version
+
     def get_version(self, requested_version):
-        compatible_version = None
-        for api_version in sorted(self.versions.keys(), key=version.parse, reverse=True):
-            if version.parse(requested_version) >= version.parse(api_version):
-                compatible_version = api_version
-                break
+        compatible_version = self.resolve_version(requested_version)
 
         if compatible_version:
             return self.versions[compatible_version]
@@ -29,6 +50,10 @@ class VersionManager:
     def remove_version(self, api_version):
         if api_version in self.versions:
             del self.versions[api_version]
+            index = self.version_keys.index(api_version)
+            del self.parsed_versions[index]
+            del self.version_keys[index]
+            self.resolved.clear()
             self.logger.info(f"Removed API version: {api_version}")
         else:
-            self.logger.warning(f"Version {api_version} not found")
\ No newline at end of file
+            self.logger.warning(f"Version {api_version} not found")
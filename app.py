@@ -10,7 +10,7 @@ def index():
 
 @app.route('/api/core/status')
 def get_status():
-    return kernel.get_status()
+    return jsonify(kernel.get_status())
 
 @app.route('/api/core/start', methods=['POST'])
 def start_kernel():
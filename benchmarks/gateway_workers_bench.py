@@ -0,0 +1,92 @@
+import argparse
+import http.client
+import json
+import multiprocessing
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from api_gateway.router import APIRouter
+from security.authentication import Authentication
+from security.access_control import AccessControl
+
+
+class EchoKernel:
+    def process_command(self, command):
+        return command
+
+
+def serve(port, workers):
+    auth = Authentication("bench-secret-key")
+    router = APIRouter(EchoKernel(), auth, AccessControl())
+    router.rate_limiter.max_requests = 10 ** 9
+    router.run(host="127.0.0.1", port=port, workers=workers)
+
+
+def client(port, token, duration, counter):
+    body = json.dumps({"command": "echo"})
+    headers = {"Authorization": f"Bearer {token}", "Content-Type": "application/json"}
+    connection = http.client.HTTPConnection("127.0.0.1", port)
+    completed = 0
+    deadline = time.perf_counter() + duration
+    while time.perf_counter() < deadline:
+        connection.request("POST", "/execute_task", body=body, headers=headers)
+        connection.getresponse().read()
+        completed += 1
+    with counter.get_lock():
+        counter.value += completed
+
+
+def wait_for_server(port, timeout=10):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            connection = http.client.HTTPConnection("127.0.0.1", port)
+            connection.request("GET", "/docs")
+            connection.getresponse().read()
+            return
+        except OSError:
+            time.sleep(0.1)
+    raise RuntimeError("Gateway did not start in time")
+
+
+def bench(workers, clients, duration, port):
+    server = multiprocessing.Process(target=serve, args=(port, workers))
+    server.start()
+    try:
+        wait_for_server(port)
+        token = Authentication("bench-secret-key").generate_token(1)
+        counter = multiprocessing.Value('l', 0)
+        processes = [multiprocessing.Process(target=client, args=(port, token, duration, counter))
+                     for _ in range(clients)]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+        return counter.value / duration
+    finally:
+        server.terminate()
+        server.join()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure gateway requests/sec from 1 to N workers")
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--clients", type=int, default=2 * (os.cpu_count() or 1))
+    parser.add_argument("--duration", type=float, default=5.0)
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    workers = 1
+    baseline = None
+    while workers <= args.max_workers:
+        rps = bench(workers, args.clients, args.duration, args.port)
+        baseline = baseline or rps
+        print(f"workers={workers:<3} {rps:>10,.0f} req/s  x{rps / baseline:.2f}")
+        workers *= 2
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from api_gateway.rate_limiter import RateLimiter, KeyedRateLimiter
+
+
+def bench_deque(requests, max_requests, time_window):
+    limiter = RateLimiter(max_requests=max_requests, time_window=time_window)
+    start = time.perf_counter()
+    for _ in requests:
+        limiter.allow_request()
+    return time.perf_counter() - start
+
+
+def bench_keyed(requests, max_requests, time_window):
+    limiter = KeyedRateLimiter(max_requests=max_requests, time_window=time_window)
+    start = time.perf_counter()
+    for key in requests:
+        limiter.allow_request(key)
+    return time.perf_counter() - start, limiter.get_key_count()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the global deque limiter with the keyed limiter")
+    parser.add_argument("--requests", type=int, default=200000)
+    parser.add_argument("--tenants", type=int, default=5000)
+    parser.add_argument("--max-requests", type=int, default=10000)
+    parser.add_argument("--time-window", type=float, default=1.0)
+    args = parser.parse_args()
+
+    requests = [f"tenant-{random.randrange(args.tenants)}" for _ in range(args.requests)]
+
+    deque_time = bench_deque(requests, args.max_requests, args.time_window)
+    keyed_time, keys = bench_keyed(requests, args.max_requests, args.time_window)
+
+    print(f"requests={args.requests} tenants={args.tenants} max_requests={args.max_requests}")
+    print(f"deque (global): {deque_time:.3f}s  {args.requests / deque_time:,.0f} req/s")
+    print(f"keyed (per-key): {keyed_time:.3f}s  {args.requests / keyed_time:,.0f} req/s  keys={keys}")
+
+
+if __name__ == "__main__":
+    main()
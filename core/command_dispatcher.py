@@ -0,0 +1,168 @@
+import asyncio
+import functools
+import inspect
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+
+class CommandError(ValueError):
+    pass
+
+
+class CommandSpec:
+    # Schema maps a parameter name to a type (required) or to a (type, required) tuple; a type of None
+    # accepts any value. Everything is compiled here once so per-call validation is a few set/dict checks.
+    def __init__(self, name: str, handler: Callable[..., Any], schema: Optional[Dict[str, Any]], mode: str):
+        self.name = name
+        self.handler = handler
+        self.mode = mode
+        self.types = {}
+        required = set()
+        for param, rule in (schema or {}).items():
+            param_type, is_required = rule if isinstance(rule, tuple) else (rule, True)
+            if param_type is not None:
+                self.types[param] = param_type
+            if is_required:
+                required.add(param)
+        self.required = frozenset(required)
+        self.allowed = frozenset(schema) if schema is not None else None
+        if self.allowed is not None and self._accepts_var_kwargs(handler):
+            self.allowed = None
+
+        self.calls = 0
+        self.errors = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+
+    @staticmethod
+    def _accepts_var_kwargs(handler):
+        try:
+            parameters = inspect.signature(handler).parameters.values()
+        except (TypeError, ValueError):
+            return True
+        return any(p.kind == inspect.Parameter.VAR_KEYWORD for p in parameters)
+
+    def validate(self, params: Dict[str, Any]):
+        missing = self.required.difference(params)
+        if missing:
+            raise CommandError(f"Command {self.name} missing parameters: {', '.join(sorted(missing))}")
+        if self.allowed is not None and not self.allowed.issuperset(params):
+            unexpected = set(params).difference(self.allowed)
+            raise CommandError(f"Command {self.name} got unexpected parameters: {', '.join(sorted(unexpected))}")
+        for param, param_type in self.types.items():
+            if param in params and not isinstance(params[param], param_type):
+                raise CommandError(f"Parameter {param} of command {self.name} must be of type {param_type}")
+
+    def record(self, elapsed: float, failed: bool):
+        self.calls += 1
+        self.total_time += elapsed
+        if elapsed > self.max_time:
+            self.max_time = elapsed
+        if failed:
+            self.errors += 1
+
+
+class CommandDispatcher:
+    MODES = ('sync', 'async', 'cpu')
+
+    def __init__(self, max_workers: int = None, cpu_workers: int = None):
+        self.logger = logging.getLogger(__name__)
+        self.handlers: Dict[str, CommandSpec] = {}
+        self.max_workers = max_workers
+        self.cpu_workers = cpu_workers or os.cpu_count()
+        self.thread_pool = None
+        self.process_pool = None
+
+    def register(self, name: str, handler: Callable[..., Any], schema: Dict[str, Any] = None, mode: str = 'sync'):
+        if mode not in self.MODES:
+            raise ValueError(f"Unsupported handler mode: {mode}")
+        if mode == 'async' and not inspect.iscoroutinefunction(handler):
+            raise ValueError(f"Handler for {name} must be a coroutine function in async mode")
+        self.handlers[name] = CommandSpec(name, handler, schema, mode)
+        self.logger.info(f"Registered command: {name} ({mode})")
+
+    def unregister(self, name: str):
+        if name in self.handlers:
+            del self.handlers[name]
+            self.logger.info(f"Unregistered command: {name}")
+        else:
+            self.logger.warning(f"Command {name} not found")
+
+    def list_commands(self) -> list:
+        return list(self.handlers.keys())
+
+    def _lookup(self, name: str, params: Optional[Dict[str, Any]]):
+        spec = self.handlers.get(name)
+        if spec is None:
+            raise CommandError(f"Unknown command: {name}")
+        params = params or {}
+        if not isinstance(params, dict):
+            raise CommandError(f"Parameters of command {name} must be an object")
+        spec.validate(params)
+        return spec, params
+
+    def _get_thread_pool(self):
+        if self.thread_pool is None:
+            self.thread_pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="command")
+        return self.thread_pool
+
+    def _get_process_pool(self):
+        if self.process_pool is None:
+            self.process_pool = ProcessPoolExecutor(max_workers=self.cpu_workers)
+        return self.process_pool
+
+    def dispatch(self, name: str, params: Dict[str, Any] = None):
+        spec, params = self._lookup(name, params)
+        start = time.perf_counter()
+        failed = True
+        try:
+            if spec.mode == 'sync':
+                result = spec.handler(**params)
+            elif spec.mode == 'async':
+                result = asyncio.run(spec.handler(**params))
+            else:
+                result = self._get_process_pool().submit(spec.handler, **params).result()
+            failed = False
+            return result
+        finally:
+            spec.record(time.perf_counter() - start, failed)
+
+    async def dispatch_async(self, name: str, params: Dict[str, Any] = None):
+        spec, params = self._lookup(name, params)
+        start = time.perf_counter()
+        failed = True
+        try:
+            if spec.mode == 'async':
+                result = await spec.handler(**params)
+            elif spec.mode == 'sync':
+                loop = asyncio.get_running_loop()
+                result = await loop.run_in_executor(self._get_thread_pool(), functools.partial(spec.handler, **params))
+            else:
+                result = await asyncio.wrap_future(self._get_process_pool().submit(spec.handler, **params))
+            failed = False
+            return result
+        finally:
+            spec.record(time.perf_counter() - start, failed)
+
+    def get_metrics(self) -> Dict[str, Dict[str, Any]]:
+        return {
+            name: {
+                'mode': spec.mode,
+                'calls': spec.calls,
+                'errors': spec.errors,
+                'avg_ms': (spec.total_time / spec.calls * 1000) if spec.calls else 0.0,
+                'max_ms': spec.max_time * 1000
+            }
+            for name, spec in self.handlers.items()
+        }
+
+    def shutdown(self, wait=True):
+        if self.thread_pool is not None:
+            self.thread_pool.shutdown(wait=wait)
+            self.thread_pool = None
+        if self.process_pool is not None:
+            self.process_pool.shutdown(wait=wait)
+            self.process_pool = None
@@ -1,40 +1,120 @@
+import atexit
 import json
 import logging
+import os
+import tempfile
+import time
 from pathlib import Path
+from threading import RLock, Timer
 
 class DynamicConfig:
-    def __init__(self, config_file='config.json'):
+    def __init__(self, config_file='config.json', write_delay=0.0, reload_interval=1.0):
         self.logger = logging.getLogger(__name__)
         self.config_file = Path(config_file)
         self.config = {}
+        self.write_delay = write_delay  # seconds to coalesce changes before writing; 0 writes immediately
+        self.reload_interval = reload_interval  # minimum seconds between stat checks for external edits
+        self.lock = RLock()
+        self.dirty = False
+        self.write_timer = None
+        self.file_signature = None
+        self.next_check = 0.0
+        # The write-behind timer is a daemon thread, so a pending write must be flushed explicitly on exit
+        atexit.register(self._write_behind)
+
+    def _stat_signature(self):
+        try:
+            stat = self.config_file.stat()
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
 
     def load_config(self):
         self.logger.info(f"Loading configuration from {self.config_file}")
-        if self.config_file.exists():
-            with open(self.config_file, 'r') as f:
-                self.config = json.load(f)
-        else:
-            self.logger.warning(f"Config file {self.config_file} not found. Using default configuration.")
-            self.config = self.get_default_config()
+        with self.lock:
+            if self.config_file.exists():
+                with open(self.config_file, 'r') as f:
+                    self.config = json.load(f)
+                self.file_signature = self._stat_signature()
+            else:
+                self.logger.warning(f"Config file {self.config_file} not found. Using default configuration.")
+                self.config = self.get_default_config()
+            self.next_check = time.monotonic() + self.reload_interval
         self.logger.info("Configuration loaded successfully")
 
     def save_config(self):
         self.logger.info(f"Saving configuration to {self.config_file}")
-        with open(self.config_file, 'w') as f:
-            json.dump(self.config, f, indent=4)
+        with self.lock:
+            if self.write_timer is not None:
+                self.write_timer.cancel()
+                self.write_timer = None
+            directory = self.config_file.parent
+            fd, temp_path = tempfile.mkstemp(dir=directory, prefix=f".{self.config_file.name}.", suffix=".tmp")
+            try:
+                if self.config_file.exists():
+                    os.chmod(temp_path, self.config_file.stat().st_mode & 0o777)
+                with os.fdopen(fd, 'w') as f:
+                    json.dump(self.config, f, indent=4)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(temp_path, self.config_file)
+            except Exception:
+                os.unlink(temp_path)
+                raise
+            self.dirty = False
+            self.file_signature = self._stat_signature()
         self.logger.info("Configuration saved successfully")
 
+    def _schedule_save(self):
+        with self.lock:
+            self.dirty = True
+            if self.write_delay <= 0:
+                self.save_config()
+            elif self.write_timer is None:
+                # Changes arriving inside the window ride along with the pending write
+                self.write_timer = Timer(self.write_delay, self._write_behind)
+                self.write_timer.daemon = True
+                self.write_timer.start()
+
+    def _write_behind(self):
+        try:
+            self.flush()
+        except Exception as e:
+            self.logger.error(f"Error writing configuration: {str(e)}")
+
+    def flush(self):
+        with self.lock:
+            if self.dirty:
+                self.save_config()
+
+    def reload_if_changed(self):
+        now = time.monotonic()
+        if now < self.next_check:
+            return False
+        with self.lock:
+            self.next_check = now + self.reload_interval
+            signature = self._stat_signature()
+            # Never clobber unsaved local changes with the on-disk copy
+            if signature is None or signature == self.file_signature or self.dirty:
+                return False
+            self.logger.info(f"Detected external change to {self.config_file}")
+            self.load_config()
+            return True
+
     def update_config(self, new_config):
         self.logger.info("Updating configuration")
-        self.config.update(new_config)
-        self.save_config()
+        with self.lock:
+            self.config.update(new_config)
+            self._schedule_save()
 
     def get_config(self, key, default=None):
+        self.reload_if_changed()
         return self.config.get(key, default)
 
     def set_config(self, key, value):
-        self.config[key] = value
-        self.save_config()
+        with self.lock:
+            self.config[key] = value
+            self._schedule_save()
 
     @staticmethod
     def get_default_config():
@@ -42,5 +122,7 @@ class DynamicConfig:
             "log_level": "INFO",
             "max_tasks": 10,
             "default_ai_model": "gpt-3.5-turbo",
-            "api_rate_limit": 100
-        }
\ No newline at end of file
+            "api_rate_limit": 100,
+            "status_cache_ttl": 1.0,
+            "gateway_workers": 1
+        }
@@ -1,5 +1,7 @@
 from core.kernel import Kernel
 from core.resource_manager import ResourceManager
 from core.dynamic_config import DynamicConfig
+from core.status_cache import StatusCache
+from core.command_dispatcher import CommandDispatcher, CommandError
 
-__all__ = ['Kernel', 'ResourceManager', 'DynamicConfig']
\ No newline at end of file
+__all__ = ['Kernel', 'ResourceManager', 'DynamicConfig', 'StatusCache', 'CommandDispatcher', 'CommandError']
\ No newline at end of file
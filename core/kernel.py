@@ -1,44 +1,59 @@
 import logging
-from flask import jsonify
 from core.resource_manager import ResourceManager
 from core.dynamic_config import DynamicConfig
+from core.status_cache import StatusCache
+from core.command_dispatcher import CommandDispatcher
 
 
 class Kernel:
     def __init__(self):
         self.logger = logging.getLogger(__name__)
         self.resource_manager = ResourceManager()
-        self.dynamic_config = DynamicConfig()
+        self.dynamic_config = DynamicConfig(write_delay=0.5)
+        self.status_cache = StatusCache(self.resource_manager.check_resources)
+        self.dispatcher = CommandDispatcher()
+        self.register_builtin_commands()
         self.logger.info("Kernel initialized")
 
+    def register_builtin_commands(self):
+        self.dispatcher.register("check_resources", lambda: self.status_cache.get()[0], schema={})
+        self.dispatcher.register("get_config", self.dynamic_config.get_config,
+                                 schema={"key": str, "default": (None, False)})
+        self.dispatcher.register("update_config", self.update_config, schema={"new_config": dict})
+
     def start(self):
         self.logger.info("Starting kernel")
         self.resource_manager.initialize()
         self.dynamic_config.load_config()
+        self.status_cache.ttl = self.dynamic_config.get_config("status_cache_ttl", self.status_cache.ttl)
         # Add more initialization logic here
         self.logger.info("Kernel started successfully")
 
     def stop(self):
         self.logger.info("Stopping kernel")
         self.resource_manager.cleanup()
-        self.dynamic_config.save_config()
+        self.dispatcher.shutdown(wait=False)
+        self.dynamic_config.flush()
         # Add more cleanup logic here
         self.logger.info("Kernel stopped successfully")
 
     def process_command(self, command):
         self.logger.info(f"Processing command: {command}")
-        # Add command processing logic here
-        return f"Processed command: {command}"
+        if isinstance(command, dict):
+            return self.dispatcher.dispatch(command.get("command"), command.get("params"))
+        return self.dispatcher.dispatch(command)
 
     def update_config(self, new_config):
         self.logger.info("Updating configuration")
         self.dynamic_config.update_config(new_config)
+        self.status_cache.ttl = self.dynamic_config.get_config("status_cache_ttl", self.status_cache.ttl)
         # Add logic to apply new configuration
         self.logger.info("Configuration updated successfully")
 
     def get_status(self):
-        return jsonify({
+        resources, _ = self.status_cache.get()
+        return {
             "status": "running",
-            "resources": self.resource_manager.check_resources(),
+            "resources": resources,
             "config": self.dynamic_config.config
-        })
\ No newline at end of file
+        }
\ No newline at end of file
@@ -1,40 +1,204 @@
 import psutil
 import logging
+import os
+import time
+import weakref
+from array import array
+from threading import Thread, Event, Condition
+
+
+class MetricRing:
+    FIELDS = ('timestamp', 'cpu', 'memory', 'disk', 'network')
+
+    # Samples are rows in one flat array of doubles. The single writer fills a row and only then bumps
+    # `count`; readers copy the array in one slice (atomic under the GIL) and ignore the row being written.
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.width = len(self.FIELDS)
+        self.buffer = array('d', [0.0]) * (capacity * self.width)
+        self.count = 0
+
+    def append(self, values):
+        start = (self.count % self.capacity) * self.width
+        self.buffer[start:start + self.width] = array('d', values)
+        self.count += 1
+
+    def snapshot(self, samples: int = None):
+        count = self.count
+        data = self.buffer[:]
+        available = min(count, self.capacity - 1)
+        if samples is not None:
+            available = min(available, samples)
+        rows = []
+        for i in range(count - available, count):
+            start = (i % self.capacity) * self.width
+            rows.append(data[start:start + self.width])
+        return rows
+
 
 class ResourceManager:
-    def __init__(self):
+    def __init__(self, sample_interval: float = 1.0, history_size: int = 300, average_window: int = 10):
         self.logger = logging.getLogger(__name__)
         self.cpu_threshold = 80  # percentage
         self.memory_threshold = 80  # percentage
+        self.sample_interval = sample_interval  # seconds
+        self.average_window = average_window  # samples
+        self.history = MetricRing(history_size)
+        self.stop_event = Event()
+        self.sampler = None
+
+        self.cpu_capacity = (psutil.cpu_count() or 1) * self.cpu_threshold / 100  # cores
+        self.memory_capacity = psutil.virtual_memory().total / (1024 * 1024) * self.memory_threshold / 100  # MB
+        self.reservations = {}
+        self.reserved_cpu = 0.0
+        self.reserved_memory = 0.0
+        self.admission = Condition()
+
+        # Gateway workers are forked after the kernel starts; threads do not survive a fork, so each
+        # child restarts its own sampler instead of serving the pre-fork sample forever
+        if hasattr(os, 'register_at_fork'):
+            manager = weakref.ref(self)
+            os.register_at_fork(after_in_child=lambda: manager() and manager()._restart_after_fork())
+
+    def _restart_after_fork(self):
+        # The sampler may have held the admission lock when the parent forked
+        self.admission = Condition()
+        if self.sampler is not None and not self.stop_event.is_set():
+            self.sampler = None
+            self.initialize()
 
     def initialize(self):
         self.logger.info("Initializing Resource Manager")
-        # Add any initialization logic here
+        if self.sampler is None or not self.sampler.is_alive():
+            self.stop_event.clear()
+            self.sampler = Thread(target=self._sample_loop, name="resource-sampler", daemon=True)
+            self.sampler.start()
 
     def cleanup(self):
         self.logger.info("Cleaning up Resource Manager")
-        # Add any cleanup logic here
+        self.stop_event.set()
+        if self.sampler is not None:
+            self.sampler.join()
+            self.sampler = None
+
+    def _sample_loop(self):
+        # Prime cpu_percent so every later reading covers exactly one sampling interval
+        psutil.cpu_percent(interval=None)
+        counters = psutil.net_io_counters()
+        last_bytes, last_time = counters.bytes_sent + counters.bytes_recv, time.time()
+        while not self.stop_event.wait(self.sample_interval):
+            try:
+                now = time.time()
+                counters = psutil.net_io_counters()
+                total_bytes = counters.bytes_sent + counters.bytes_recv
+                network_rate = (total_bytes - last_bytes) / max(now - last_time, 1e-9)
+                last_bytes, last_time = total_bytes, now
+                self.history.append((
+                    now,
+                    psutil.cpu_percent(interval=None),
+                    psutil.virtual_memory().percent,
+                    psutil.disk_usage('/').percent,
+                    network_rate
+                ))
+            except Exception as e:
+                self.logger.error(f"Error sampling resources: {str(e)}")
+                continue
+            with self.admission:
+                self.admission.notify_all()
+
+    def get_history(self, samples: int = None):
+        rows = self.history.snapshot(samples)
+        return {field: [row[i] for row in rows] for i, field in enumerate(MetricRing.FIELDS)}
+
+    def get_moving_averages(self, samples: int = None):
+        rows = self.history.snapshot(samples or self.average_window)
+        if not rows:
+            return None
+        return {field: sum(row[i] for row in rows) / len(rows)
+                for i, field in enumerate(MetricRing.FIELDS) if field != 'timestamp'}
 
     def check_resources(self):
-        cpu_percent = psutil.cpu_percent()
-        memory_percent = psutil.virtual_memory().percent
+        rows = self.history.snapshot(1)
+        if rows:
+            _, cpu_percent, memory_percent, disk_percent, network_rate = rows[0]
+            averages = self.get_moving_averages()
+        else:
+            cpu_percent = psutil.cpu_percent()
+            memory_percent = psutil.virtual_memory().percent
+            disk_percent, network_rate, averages = None, None, None
 
+        cpu_level = averages['cpu'] if averages else cpu_percent
+        memory_level = averages['memory'] if averages else memory_percent
         status = "normal"
-        if cpu_percent > self.cpu_threshold or memory_percent > self.memory_threshold:
+        if cpu_level > self.cpu_threshold or memory_level > self.memory_threshold:
             status = "high"
 
         return {
             'status': status,
             'cpu': cpu_percent,
-            'memory': memory_percent
+            'memory': memory_percent,
+            'disk': disk_percent,
+            'network': network_rate,
+            'averages': averages,
+            'reserved_cpu': self.reserved_cpu,
+            'reserved_memory': self.reserved_memory
         }
 
-    def allocate_resources(self, task):
+    @staticmethod
+    def _task_key(task):
+        if isinstance(task, dict):
+            return task.get('id', id(task))
+        try:
+            hash(task)
+            return task
+        except TypeError:
+            return id(task)
+
+    @staticmethod
+    def _task_budget(task):
+        if isinstance(task, dict):
+            return float(task.get('cpu', 0)), float(task.get('memory', 0))  # cores, MB
+        return 0.0, 0.0
+
+    def _is_saturated(self):
+        averages = self.get_moving_averages()
+        if not averages:
+            return False
+        return averages['cpu'] > self.cpu_threshold or averages['memory'] > self.memory_threshold
+
+    def _can_admit(self, cpu, memory):
+        return (self.reserved_cpu + cpu <= self.cpu_capacity
+                and self.reserved_memory + memory <= self.memory_capacity
+                and not self._is_saturated())
+
+    def allocate_resources(self, task, timeout: float = None):
         self.logger.info(f"Allocating resources for task: {task}")
-        # Add logic to allocate resources for a task
+        key = self._task_key(task)
+        cpu, memory = self._task_budget(task)
+        deadline = time.monotonic() + timeout if timeout else None
+        with self.admission:
+            if key in self.reservations:
+                return True
+            while not self._can_admit(cpu, memory):
+                remaining = deadline - time.monotonic() if deadline else 0
+                if remaining <= 0:
+                    self.logger.warning(f"Rejecting task {key}: node saturated or budget exhausted")
+                    return False
+                self.admission.wait(remaining)
+            self.reservations[key] = (cpu, memory)
+            self.reserved_cpu += cpu
+            self.reserved_memory += memory
         return True
 
     def release_resources(self, task):
         self.logger.info(f"Releasing resources for task: {task}")
-        # Add logic to release resources after a task is complete
-        return True
\ No newline at end of file
+        key = self._task_key(task)
+        with self.admission:
+            budget = self.reservations.pop(key, None)
+            if budget is None:
+                self.logger.warning(f"No reservation found for task {key}")
+                return False
+            self.reserved_cpu -= budget[0]
+            self.reserved_memory -= budget[1]
+            self.admission.notify_all()
+        return True
@@ -0,0 +1,87 @@
+import importlib
+import logging
+import sys
+import time
+from contextlib import contextmanager
+from typing import Any, Dict
+
+
+class LazyComponent:
+    # Stands in for a component until first attribute access, then imports its module and builds it
+    def __init__(self, profiler, name: str, module_name: str, class_name: str, args, kwargs):
+        self._profiler = profiler
+        self._name = name
+        self._module_name = module_name
+        self._class_name = class_name
+        self._args = args
+        self._kwargs = kwargs
+        self._instance = None
+
+    def _resolve(self):
+        if self._instance is None:
+            component_class = self._profiler.load(self._module_name, self._class_name)
+            with self._profiler.component(self._name):
+                self._instance = component_class(*self._args, **self._kwargs)
+        return self._instance
+
+    def __getattr__(self, item):
+        return getattr(self._resolve(), item)
+
+    def __repr__(self):
+        state = "loaded" if self._instance is not None else "not loaded"
+        return f"<LazyComponent {self._name} ({state})>"
+
+
+class StartupProfiler:
+    def __init__(self, budget: float = None):
+        self.logger = logging.getLogger(__name__)
+        self.budget = budget  # seconds
+        self.started_at = time.perf_counter()
+        self.imports: Dict[str, Dict[str, Any]] = {}
+        self.components: Dict[str, float] = {}
+        self.import_seconds = 0.0
+
+    def load(self, module_name: str, attribute: str = None):
+        if module_name not in self.imports:
+            before = set(sys.modules)
+            start = time.perf_counter()
+            module = importlib.import_module(module_name)
+            elapsed = time.perf_counter() - start
+            self.import_seconds += elapsed
+            # Top-level packages this import pulled in for the first time, e.g. pandas or fastapi
+            pulled_in = sorted({name.split('.')[0] for name in set(sys.modules) - before} - {module_name.split('.')[0]})
+            self.imports[module_name] = {'seconds': elapsed, 'pulled_in': pulled_in}
+        else:
+            module = sys.modules[module_name]
+        return getattr(module, attribute) if attribute else module
+
+    @contextmanager
+    def component(self, name: str):
+        # Imports made inside the block are reported separately, so they are not counted as init time
+        start, imports_before = time.perf_counter(), self.import_seconds
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start - (self.import_seconds - imports_before)
+            self.components[name] = self.components.get(name, 0.0) + elapsed
+
+    def lazy(self, name: str, module_name: str, class_name: str, *args, **kwargs) -> LazyComponent:
+        return LazyComponent(self, name, module_name, class_name, args, kwargs)
+
+    def report(self) -> Dict[str, Any]:
+        total = time.perf_counter() - self.started_at
+        self.logger.info(f"Startup finished in {total * 1000:.1f} ms")
+        for module_name, entry in sorted(self.imports.items(), key=lambda item: -item[1]['seconds']):
+            pulled_in = f" (pulled in: {', '.join(entry['pulled_in'])})" if entry['pulled_in'] else ""
+            self.logger.info(f"  import {module_name}: {entry['seconds'] * 1000:.1f} ms{pulled_in}")
+        for name, seconds in sorted(self.components.items(), key=lambda item: -item[1]):
+            self.logger.info(f"  init {name}: {seconds * 1000:.1f} ms")
+        if self.budget is not None and total > self.budget:
+            self.logger.warning(f"Startup took {total:.3f}s, over the {self.budget:.3f}s budget")
+        return {
+            'total_seconds': total,
+            'budget_seconds': self.budget,
+            'within_budget': self.budget is None or total <= self.budget,
+            'imports': self.imports,
+            'components': self.components
+        }
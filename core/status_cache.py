@@ -0,0 +1,53 @@
+import hashlib
+import json
+import logging
+import time
+from threading import Condition
+
+
+class StatusCache:
+    def __init__(self, loader, ttl: float = 1.0):
+        self.logger = logging.getLogger(__name__)
+        self.loader = loader
+        self.ttl = ttl  # in seconds
+        self.entry = None  # (snapshot, etag, expires_at), swapped as one object so readers never see a torn entry
+        self.refreshing = False
+        self.condition = Condition()
+
+    def peek(self):
+        entry = self.entry
+        if entry is not None and time.monotonic() < entry[2]:
+            return entry[0], entry[1]
+        return None
+
+    def get(self):
+        cached = self.peek()
+        if cached is not None:
+            return cached
+
+        with self.condition:
+            # Single flight: only one caller runs the loader, the rest wait for its result
+            while self.refreshing:
+                self.condition.wait()
+            cached = self.peek()
+            if cached is not None:
+                return cached
+            self.refreshing = True
+
+        try:
+            snapshot = self.loader()
+            etag = hashlib.sha1(json.dumps(snapshot, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+            entry = (snapshot, f'"{etag}"', time.monotonic() + self.ttl)
+            self.entry = entry
+        except Exception as e:
+            self.logger.error(f"Error refreshing status snapshot: {str(e)}")
+            raise
+        finally:
+            with self.condition:
+                self.refreshing = False
+                self.condition.notify_all()
+
+        return entry[0], entry[1]
+
+    def invalidate(self):
+        self.entry = None
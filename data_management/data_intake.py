@@ -1,13 +1,40 @@
 import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+import numpy as np
 import pandas as pd
-from typing import Union, List
+from typing import Any, Dict, Iterator, List, Optional, Union
+from .validation import DataValidator
+
+
+def _parse_file(path: str, data_type: str, columns, dtype, parse_dates):
+    # Runs in a worker process; returns the parsed part and how long parsing took there
+    started = time.perf_counter()
+    if data_type == 'csv':
+        usecols = list(dict.fromkeys(list(columns) + list(parse_dates or []))) if columns is not None else None
+        data = pd.read_csv(path, usecols=usecols, dtype=dtype, parse_dates=parse_dates or False)
+    elif data_type in ('json', 'jsonl', 'ndjson'):
+        if columns is None and dtype is None and parse_dates is None:
+            # Without a schema, parse exactly as the sequential ingest_data path does
+            data = pd.read_json(path, lines=data_type != 'json')
+        else:
+            data = pd.read_json(path, lines=data_type != 'json', dtype=False, convert_dates=False)
+            data = DataIntake._apply_schema(data, columns, dtype, parse_dates)
+    else:
+        raise ValueError(f"Unsupported data type: {data_type}")
+    return data, time.perf_counter() - started
 
 
 class DataIntake:
     def __init__(self):
         self.logger = logging.getLogger(__name__)
+        self.parse_stats: List[Dict[str, Any]] = []  # per-file parse times of the latest parallel ingest
 
-    def ingest_data(self, source: Union[str, List[str]], data_type: str = 'csv') -> pd.DataFrame:
+    def ingest_data(self, source: Union[str, List[str]], data_type: str = 'csv', parallel: bool = False) -> pd.DataFrame:
+        if parallel and isinstance(source, list):
+            return self.ingest_parallel(source, data_type)
         self.logger.info(f"Ingesting data from {source}")
         try:
             if data_type == 'csv':
@@ -33,19 +60,163 @@ class DataIntake:
             self.logger.error(f"Error ingesting data: {str(e)}")
             raise
 
-    def validate_data(self, data: pd.DataFrame, schema: dict) -> bool:
+    def ingest_parallel(self, source: Union[str, List[str]], data_type: str = 'csv', max_workers: int = None,
+                        lazy: bool = False, columns: Optional[List[str]] = None,
+                        dtype: Optional[Dict[str, str]] = None,
+                        parse_dates: Optional[List[str]] = None) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]:
+        # Parses files in a process pool. lazy=True yields the parts in source order as they become
+        # available; otherwise plain NumPy columns are copied into preallocated buffers, releasing each part once
+        # copied, and anything else is concatenated
+        sources = self._expand_sources(source, data_type)
+        if not sources:
+            raise ValueError(f"No {data_type} files found in {source}")
+        if max_workers is None:
+            max_workers = len(os.sched_getaffinity(0)) if hasattr(os, 'sched_getaffinity') else os.cpu_count()
+        max_workers = max(1, min(max_workers or 1, len(sources)))
+        self.logger.info(f"Ingesting {len(sources)} files with {max_workers} worker processes")
+
+        self.parse_stats = []
+        parts = self._parse_parallel(sources, data_type, max_workers, columns, dtype, parse_dates)
+        if lazy:
+            return parts
+        try:
+            data = self._assemble(list(parts))
+        except Exception as e:
+            self.logger.error(f"Error ingesting data: {str(e)}")
+            raise
+        self.logger.info(f"Successfully ingested data. Shape: {data.shape}")
+        return data
+
+    def _expand_sources(self, source: Union[str, List[str]], data_type: str) -> List[str]:
+        if isinstance(source, str):
+            if os.path.isdir(source):
+                suffixes = ('.csv',) if data_type == 'csv' else ('.json', '.jsonl', '.ndjson')
+                return sorted(os.path.join(source, name) for name in os.listdir(source)
+                              if name.lower().endswith(suffixes))
+            return [source]
+        if isinstance(source, list):
+            return source
+        raise ValueError("Source must be a string or list of strings")
+
+    def _parse_parallel(self, sources: List[str], data_type: str, max_workers: int, columns, dtype,
+                        parse_dates) -> Iterator[pd.DataFrame]:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(_parse_file, path, data_type, columns, dtype, parse_dates) for path in sources]
+            for index, path in enumerate(sources):
+                part, seconds = futures[index].result()
+                self.parse_stats.append({'source': path, 'rows': len(part), 'seconds': seconds})
+                self.logger.info(f"Parsed {path}: {len(part)} rows in {seconds:.3f}s")
+                # Drop the future's reference so the part can be freed as soon as the caller is done with it
+                futures[index] = None
+                yield part
+
+    def _assemble(self, parts: List[pd.DataFrame]) -> pd.DataFrame:
+        columns = list(parts[0].columns)
+        if any(list(part.columns) != columns for part in parts[1:]):
+            self.logger.warning("Files have different columns; falling back to pd.concat")
+            return pd.concat(parts, ignore_index=True)
+
+        dtypes = {column: [part[column].dtype for part in parts] for column in columns}
+        for column, kinds in dtypes.items():
+            numeric = all(isinstance(kind, np.dtype) and kind.kind in 'biufc' for kind in kinds)
+            temporal = all(isinstance(kind, np.dtype) and kind.kind in 'mM' for kind in kinds) and len(set(kinds)) == 1
+            if not (numeric or temporal):
+                # Strings, categoricals and nullable extension types keep their dtype only through concat
+                return pd.concat(parts, ignore_index=True)
+
+        total = sum(len(part) for part in parts)
+        buffers = {column: np.empty(total, dtype=np.result_type(*kinds)) for column, kinds in dtypes.items()}
+
+        offset = 0
+        while parts:
+            part = parts.pop(0)
+            rows = len(part)
+            for column in columns:
+                buffers[column][offset:offset + rows] = part[column].to_numpy()
+            offset += rows
+            del part
+        return pd.DataFrame(buffers, columns=columns, copy=False)
+
+    def iter_data(self, source: Union[str, List[str]], data_type: str = 'csv', chunk_size: int = 100000,
+                  columns: Optional[List[str]] = None, dtype: Optional[Dict[str, str]] = None,
+                  parse_dates: Optional[List[str]] = None,
+                  validator: Optional[DataValidator] = None) -> Iterator[pd.DataFrame]:
+        # Yields DataFrames of at most chunk_size rows so callers can process files larger than memory.
+        # The schema is applied while reading: only the selected columns are kept and converted.
+        # A validator checks each chunk as it passes; its report is complete once iteration ends
+        if validator is not None:
+            yield from validator.watch(self.iter_data(source, data_type, chunk_size, columns, dtype, parse_dates))
+            return
+        if isinstance(source, str):
+            sources = [source]
+        elif isinstance(source, list):
+            sources = source
+        else:
+            raise ValueError("Source must be a string or list of strings")
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be positive")
+
+        rows = 0
+        chunks = 0
+        for path in sources:
+            self.logger.info(f"Streaming data from {path} in chunks of {chunk_size} rows")
+            for chunk in self._read_chunks(path, data_type, chunk_size, columns, dtype, parse_dates):
+                rows += len(chunk)
+                chunks += 1
+                yield chunk
+        self.logger.info(f"Finished streaming {rows} rows in {chunks} chunks")
+
+    def _read_chunks(self, path: str, data_type: str, chunk_size: int, columns, dtype, parse_dates):
+        if data_type == 'csv':
+            # usecols, dtype and parse_dates are handled by the parser, so skipped columns are never materialized
+            usecols = columns
+            if columns is not None and parse_dates:
+                usecols = list(dict.fromkeys(list(columns) + list(parse_dates)))
+            yield from pd.read_csv(path, chunksize=chunk_size, usecols=usecols, dtype=dtype,
+                                   parse_dates=parse_dates or False)
+            return
+        if data_type in ('jsonl', 'ndjson'):
+            # The JSON Lines reader parses chunk_size lines at a time instead of loading the whole file
+            reader = pd.read_json(path, lines=True, chunksize=chunk_size, dtype=False, convert_dates=False)
+        elif data_type == 'json':
+            # A single JSON document cannot be parsed incrementally; it is read once and sliced
+            self.logger.warning(f"{path} is a JSON document, not JSON Lines; it is loaded in full before chunking")
+            data = pd.read_json(path, dtype=False, convert_dates=False)
+            reader = (data.iloc[start:start + chunk_size] for start in range(0, len(data), chunk_size))
+        else:
+            raise ValueError(f"Unsupported data type: {data_type}")
+        with reader if hasattr(reader, '__enter__') else nullcontext():
+            for chunk in reader:
+                yield self._apply_schema(chunk, columns, dtype, parse_dates)
+
+    @staticmethod
+    def _apply_schema(chunk: pd.DataFrame, columns, dtype, parse_dates) -> pd.DataFrame:
+        if columns is not None:
+            keep = list(dict.fromkeys(list(columns) + list(parse_dates or [])))
+            chunk = chunk.reindex(columns=keep)
+        if dtype:
+            chunk = chunk.astype({column: kind for column, kind in dtype.items() if column in chunk.columns})
+        for column in parse_dates or []:
+            if column in chunk.columns:
+                chunk[column] = pd.to_datetime(chunk[column])
+        return chunk
+
+    def validation_report(self, data: pd.DataFrame, schema: dict, sample: Union[int, float, None] = None,
+                          chunk_size: Optional[int] = None) -> Dict[str, Any]:
+        return DataValidator(schema).validate(data, sample=sample, chunk_size=chunk_size).to_dict()
+
+    def validate_data(self, data: pd.DataFrame, schema: dict, sample: Union[int, float, None] = None,
+                      chunk_size: Optional[int] = None) -> bool:
         self.logger.info("Validating data")
         try:
-            for column, dtype in schema.items():
-                if column not in data.columns:
-                    self.logger.error(f"Column {column} not found in data")
-                    return False
-                if data[column].dtype != dtype:
-                    self.logger.error(
-                        f"Column {column} has incorrect dtype. Expected {dtype}, got {data[column].dtype}")
-                    return False
-            self.logger.info("Data validation successful")
-            return True
+            report = DataValidator(schema).validate(data, sample=sample, chunk_size=chunk_size)
+            for column, constraints in report.violations.items():
+                for constraint, entry in constraints.items():
+                    self.logger.error(f"Column {column} failed '{constraint}' on {entry['count']} rows. "
+                                      f"Examples: {entry['examples']}")
+            if report.is_valid:
+                self.logger.info("Data validation successful")
+            return report.is_valid
         except Exception as e:
             self.logger.error(f"Error validating data: {str(e)}")
-            return False
\ No newline at end of file
+            return False
@@ -1,5 +1,7 @@
 from .data_intake import DataIntake
 from .preprocessing import Preprocessor
 from .storage_manager import StorageManager
+from .validation import DataValidator, ValidationReport
+from .pipeline_cache import PipelineCache
 
-__all__ = ['DataIntake', 'Preprocessor', 'StorageManager']
\ No newline at end of file
+__all__ = ['DataIntake', 'Preprocessor', 'StorageManager', 'DataValidator', 'ValidationReport', 'PipelineCache']
\ No newline at end of file
@@ -0,0 +1,138 @@
+import hashlib
+import json
+import logging
+import os
+import pickle
+import tempfile
+import time
+from threading import Lock
+from typing import Any, Dict, List, Optional
+
+import pandas as pd
+
+
+class PipelineCache:
+    def __init__(self, cache_dir: str = './data/pipeline_cache', max_bytes: int = 1024 ** 3,
+                 max_age: Optional[float] = 7 * 24 * 3600):
+        self.logger = logging.getLogger(__name__)
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.max_age = max_age  # seconds since last use; None keeps entries until the size limit evicts them
+        self.hits = 0
+        self.misses = 0
+        self.lock = Lock()
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    @staticmethod
+    def make_key(numeric_features: List[str], categorical_features: List[str], data: pd.DataFrame = None,
+                 fingerprint: Optional[str] = None) -> str:
+        # A known fingerprint (e.g. StorageManager.fingerprint) skips hashing the frame itself
+        import sklearn
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(json.dumps([list(numeric_features), list(categorical_features), sklearn.__version__]).encode())
+        if fingerprint is not None:
+            digest.update(f"fingerprint:{fingerprint}".encode())
+        elif data is not None:
+            columns = list(numeric_features) + list(categorical_features)
+            frame = data[columns]
+            digest.update(json.dumps({column: str(dtype) for column, dtype in frame.dtypes.items()}).encode())
+            digest.update(pd.util.hash_pandas_object(frame, index=False).to_numpy().tobytes())
+        else:
+            raise ValueError("Either data or a fingerprint is required to build a pipeline cache key")
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.joblib")
+
+    def get(self, key: str) -> Any:
+        path = self._path(key)
+        if not os.path.exists(path):
+            self.misses += 1
+            return None
+        try:
+            try:
+                import joblib
+            except ImportError:
+                with open(path, 'rb') as f:
+                    pipeline = pickle.load(f)
+            else:
+                # Fitted arrays are mapped read-only instead of copied into the process
+                pipeline = joblib.load(path, mmap_mode='r')
+        except Exception as e:
+            self.logger.error(f"Error loading cached pipeline {key}, discarding it: {str(e)}")
+            self._remove(path)
+            self.misses += 1
+            return None
+        os.utime(path)  # mtime doubles as last-used time for age and size eviction
+        self.hits += 1
+        self.logger.info(f"Loaded fitted pipeline from cache: {key}")
+        return pipeline
+
+    def put(self, key: str, pipeline: Any):
+        fd, temp_path = tempfile.mkstemp(dir=self.cache_dir, prefix=f".{key}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                try:
+                    import joblib
+                except ImportError:
+                    pickle.dump(pipeline, f)
+                else:
+                    # Uncompressed so the arrays can be memory-mapped on load
+                    joblib.dump(pipeline, f)
+            os.replace(temp_path, self._path(key))
+        except Exception:
+            self._remove(temp_path)
+            raise
+        self.logger.info(f"Cached fitted pipeline: {key}")
+        self.evict()
+
+    def _remove(self, path: str):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+    def _entries(self) -> List[Dict[str, Any]]:
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith('.joblib'):
+                continue
+            path = os.path.join(self.cache_dir, name)
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            entries.append({'key': name[:-len('.joblib')], 'path': path, 'bytes': stat.st_size,
+                            'last_used': stat.st_mtime})
+        return entries
+
+    def evict(self):
+        with self.lock:
+            entries = sorted(self._entries(), key=lambda entry: entry['last_used'])
+            now = time.time()
+            if self.max_age is not None:
+                for entry in [entry for entry in entries if now - entry['last_used'] > self.max_age]:
+                    self.logger.info(f"Evicting cached pipeline {entry['key']}: unused for {self.max_age}s")
+                    self._remove(entry['path'])
+                    entries.remove(entry)
+            total = sum(entry['bytes'] for entry in entries)
+            while entries and total > self.max_bytes:
+                entry = entries.pop(0)
+                self.logger.info(f"Evicting cached pipeline {entry['key']} to stay within {self.max_bytes} bytes")
+                self._remove(entry['path'])
+                total -= entry['bytes']
+
+    def clear(self):
+        with self.lock:
+            for entry in self._entries():
+                self._remove(entry['path'])
+
+    def get_stats(self) -> Dict[str, Any]:
+        entries = self._entries()
+        return {
+            'entries': len(entries),
+            'bytes': sum(entry['bytes'] for entry in entries),
+            'max_bytes': self.max_bytes,
+            'hits': self.hits,
+            'misses': self.misses
+        }
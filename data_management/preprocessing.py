@@ -1,18 +1,25 @@
 import logging
 import pandas as pd
 import numpy as np
-from sklearn.impute import SimpleImputer
-from sklearn.preprocessing import StandardScaler, OneHotEncoder
-from sklearn.compose import ColumnTransformer
-from sklearn.pipeline import Pipeline
 
 class Preprocessor:
-    def __init__(self):
+    def __init__(self, pipeline_cache=None):
         self.logger = logging.getLogger(__name__)
         self.pipeline = None
+        self.pipeline_cache = pipeline_cache
+        self.numeric_features: list[str] = []
+        self.categorical_features: list[str] = []
 
     def create_pipeline(self, numeric_features: list[str], categorical_features: list[str]):
         self.logger.info("Creating preprocessing pipeline")
+        self.numeric_features = list(numeric_features)
+        self.categorical_features = list(categorical_features)
+        # scikit-learn is slow to import, so it is only loaded once a pipeline is actually built
+        from sklearn.impute import SimpleImputer
+        from sklearn.preprocessing import StandardScaler, OneHotEncoder
+        from sklearn.compose import ColumnTransformer
+        from sklearn.pipeline import Pipeline
+
         numeric_transformer = Pipeline(steps=[
             ('imputer', SimpleImputer(strategy='median')),
             ('scaler', StandardScaler())
@@ -31,14 +38,25 @@ class Preprocessor:
 
         self.logger.info("Preprocessing pipeline created successfully")
 
-    def fit_transform(self, data: pd.DataFrame) -> np.ndarray:
+    def fit_transform(self, data: pd.DataFrame, fingerprint: str = None) -> np.ndarray:
+        # With a pipeline cache, a pipeline already fitted on identical features and data is loaded
+        # instead of refitted; fingerprint (e.g. from StorageManager) avoids hashing the frame
         if self.pipeline is None:
             self.logger.error("Pipeline not created. Call create_pipeline first.")
             raise ValueError("Pipeline not created")
 
+        if self.pipeline_cache is not None:
+            key = self.pipeline_cache.make_key(self.numeric_features, self.categorical_features, data, fingerprint)
+            cached = self.pipeline_cache.get(key)
+            if cached is not None:
+                self.pipeline = cached
+                return self.transform(data)
+
         self.logger.info("Fitting and transforming data")
         try:
             transformed_data = self.pipeline.fit_transform(data)
+            if self.pipeline_cache is not None:
+                self.pipeline_cache.put(key, self.pipeline)
             self.logger.info(f"Data transformed successfully. Shape: {transformed_data.shape}")
             return transformed_data
         except Exception as e:
@@ -1,16 +1,109 @@
+import hashlib
 import logging
+import numpy as np
 import pandas as pd
 import json
 import os
-from typing import Union
+import tempfile
+import time
+from threading import Lock
+from typing import Any, Dict, List, Optional, Union
 
 class StorageManager:
+    CATALOG_FILE = '_catalog.json'
+
     def __init__(self, base_path: str = './data'):
         self.logger = logging.getLogger(__name__)
         self.base_path = base_path
         os.makedirs(self.base_path, exist_ok=True)
+        self.catalog_path = os.path.join(self.base_path, self.CATALOG_FILE)
+        self.catalog_lock = Lock()
+        self.catalog: Dict[str, Dict[str, Any]] = self._load_catalog()
+
+    def _load_catalog(self) -> Dict[str, Dict[str, Any]]:
+        if not os.path.exists(self.catalog_path):
+            return {}
+        try:
+            with open(self.catalog_path, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            self.logger.error(f"Error reading data catalog, starting empty: {str(e)}")
+            return {}
+
+    def _write_catalog(self):
+        fd, temp_path = tempfile.mkstemp(dir=self.base_path, prefix=f".{self.CATALOG_FILE}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(self.catalog, f, indent=4)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, self.catalog_path)
+        except Exception:
+            os.unlink(temp_path)
+            raise
+
+    @staticmethod
+    def _hash_file(path: str) -> str:
+        digest = hashlib.blake2b(digest_size=16)
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(block)
+        return digest.hexdigest()
+
+    @staticmethod
+    def _describe(data: Any):
+        # Row count and schema come from the object being saved, so cataloguing never re-reads the file
+        if isinstance(data, pd.DataFrame):
+            return len(data), {str(column): str(dtype) for column, dtype in data.dtypes.items()}
+        if isinstance(data, np.ndarray):
+            return (data.shape[0] if data.ndim else 1), {'dtype': str(data.dtype), 'shape': list(data.shape)}
+        if isinstance(data, dict):
+            return len(data), {str(key): type(value).__name__ for key, value in data.items()}
+        return None, None
 
-    def save_data(self, data: Union[pd.DataFrame, dict], name: str, format: str = 'csv'):
+    def _update_catalog(self, name: str, format: str, full_path: str, data: Any):
+        stat = os.stat(full_path)
+        rows, schema = self._describe(data)
+        entry = {
+            'name': name,
+            'format': format,
+            'path': full_path,
+            'bytes': stat.st_size,
+            'rows': rows,
+            'schema': schema,
+            'content_hash': self._hash_file(full_path),
+            'mtime_ns': stat.st_mtime_ns,
+            'saved_at': time.time()
+        }
+        with self.catalog_lock:
+            self.catalog[f"{name}.{format}"] = entry
+            self._write_catalog()
+
+    def get_metadata(self, name: str, format: str = 'csv') -> Optional[Dict[str, Any]]:
+        return self.catalog.get(f"{name}.{format}")
+
+    def list_catalog(self) -> List[Dict[str, Any]]:
+        return list(self.catalog.values())
+
+    def fingerprint(self, name: str, format: str = 'csv') -> Optional[str]:
+        entry = self.catalog.get(f"{name}.{format}")
+        return entry['content_hash'] if entry else None
+
+    def has_changed(self, name: str, format: str = 'csv', fingerprint: Optional[str] = None) -> bool:
+        # Only stats the file: a changed size or mtime means it was rewritten outside save_data, and a
+        # differing fingerprint means it was saved again since the caller last looked
+        entry = self.catalog.get(f"{name}.{format}")
+        if entry is None:
+            return True
+        try:
+            stat = os.stat(entry['path'])
+        except FileNotFoundError:
+            return True
+        if stat.st_size != entry['bytes'] or stat.st_mtime_ns != entry['mtime_ns']:
+            return True
+        return fingerprint is not None and fingerprint != entry['content_hash']
+
+    def save_data(self, data: Union[pd.DataFrame, dict, np.ndarray], name: str, format: str = 'csv'):
         self.logger.info(f"Saving data: {name}.{format}")
         try:
             full_path = os.path.join(self.base_path, f"{name}.{format}")
@@ -24,22 +117,62 @@ class StorageManager:
                         json.dump(data, f)
                 else:
                     raise ValueError("Data must be a DataFrame or dict for JSON format")
+            elif format == 'parquet':
+                if not isinstance(data, pd.DataFrame):
+                    raise ValueError("Data must be a DataFrame for Parquet format")
+                data.to_parquet(full_path, index=False, engine='pyarrow')
+            elif format == 'feather':
+                if not isinstance(data, pd.DataFrame):
+                    raise ValueError("Data must be a DataFrame for Feather format")
+                import pyarrow.feather as feather
+                # Uncompressed Arrow IPC can be memory-mapped and read without decoding
+                feather.write_feather(data.reset_index(drop=True), full_path, compression='uncompressed')
+            elif format == 'npy':
+                if isinstance(data, pd.DataFrame):
+                    data = data.to_numpy()
+                if not isinstance(data, np.ndarray):
+                    raise ValueError("Data must be an ndarray or DataFrame for NPY format")
+                if data.dtype == object:
+                    raise ValueError("Object arrays cannot be saved in NPY format; convert them to a numeric dtype")
+                np.save(full_path, data, allow_pickle=False)
             else:
                 raise ValueError(f"Unsupported format: {format}")
+            self._update_catalog(name, format, full_path, data)
             self.logger.info(f"Data saved successfully: {full_path}")
         except Exception as e:
             self.logger.error(f"Error saving data: {str(e)}")
             raise
 
-    def load_data(self, name: str, format: str = 'csv') -> Union[pd.DataFrame, dict]:
+    def load_data(self, name: str, format: str = 'csv', columns: Optional[List[Any]] = None,
+                  as_arrow: bool = False) -> Union[pd.DataFrame, dict, np.ndarray, Any]:
+        # columns projects the load onto a subset: names for tabular formats, indices for 2-D npy arrays.
+        # Feather and npy files are memory-mapped, so untouched columns are never read from disk
         self.logger.info(f"Loading data: {name}.{format}")
         try:
             full_path = os.path.join(self.base_path, f"{name}.{format}")
             if format == 'csv':
-                data = pd.read_csv(full_path)
+                data = pd.read_csv(full_path, usecols=columns)
             elif format == 'json':
                 with open(full_path, 'r') as f:
                     data = json.load(f)
+            elif format == 'parquet':
+                import pyarrow.parquet as pq
+                table = pq.read_table(full_path, columns=columns, memory_map=True)
+                data = table if as_arrow else table.to_pandas(split_blocks=True)
+            elif format == 'feather':
+                import pyarrow as pa
+                with pa.memory_map(full_path, 'r') as source:
+                    table = pa.ipc.open_file(source).read_all()
+                if columns is not None:
+                    table = table.select(columns)
+                # The Arrow table references the mapping; to_pandas only copies columns NumPy cannot share
+                data = table if as_arrow else table.to_pandas(split_blocks=True)
+            elif format == 'npy':
+                data = np.load(full_path, mmap_mode='r', allow_pickle=False)
+                if columns is not None:
+                    if data.ndim != 2:
+                        raise ValueError("Column projection requires a 2-D array")
+                    data = data[:, columns]
             else:
                 raise ValueError(f"Unsupported format: {format}")
             self.logger.info(f"Data loaded successfully: {full_path}")
@@ -51,7 +184,8 @@ class StorageManager:
     def list_data(self) -> list[str]:
         self.logger.info("Listing available data files")
         try:
-            files = os.listdir(self.base_path)
+            files = [name for name in os.listdir(self.base_path)
+                     if name != self.CATALOG_FILE and not name.startswith(f".{self.CATALOG_FILE}.")]
             self.logger.info(f"Found {len(files)} data files")
             return files
         except Exception as e:
@@ -63,6 +197,9 @@ class StorageManager:
         try:
             full_path = os.path.join(self.base_path, f"{name}.{format}")
             os.remove(full_path)
+            with self.catalog_lock:
+                if self.catalog.pop(f"{name}.{format}", None) is not None:
+                    self._write_catalog()
             self.logger.info(f"Data deleted successfully: {full_path}")
         except Exception as e:
             self.logger.error(f"Error deleting data: {str(e)}")
@@ -0,0 +1,157 @@
+import logging
+import re
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+
+class ValidationReport:
+    def __init__(self):
+        self.rows = 0
+        self.chunks = 0
+        self.sampled = False
+        self.violations: Dict[str, Dict[str, Dict[str, Any]]] = {}  # column -> constraint -> count, examples
+
+    def add(self, column: str, constraint: str, count: int, examples: List[Any], max_examples: int):
+        if not count:
+            return
+        entry = self.violations.setdefault(column, {}).setdefault(constraint, {'count': 0, 'examples': []})
+        entry['count'] += int(count)
+        entry['examples'].extend(examples[:max_examples - len(entry['examples'])])
+
+    @property
+    def is_valid(self) -> bool:
+        return not self.violations
+
+    @property
+    def violation_count(self) -> int:
+        return sum(entry['count'] for constraints in self.violations.values() for entry in constraints.values())
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'valid': self.is_valid,
+            'rows': self.rows,
+            'chunks': self.chunks,
+            'sampled': self.sampled,
+            'violation_count': self.violation_count,
+            'violations': self.violations
+        }
+
+
+class DataValidator:
+    # Schema maps a column to either a dtype (the original validate_data format) or a dict of constraints:
+    # dtype, nullable, min, max, allowed, unique, regex
+    CONSTRAINTS = ('dtype', 'nullable', 'min', 'max', 'allowed', 'unique', 'regex')
+
+    def __init__(self, schema: Dict[str, Any], max_examples: int = 5):
+        self.logger = logging.getLogger(__name__)
+        self.max_examples = max_examples
+        self.schema: Dict[str, Dict[str, Any]] = {}
+        for column, spec in schema.items():
+            spec = dict(spec) if isinstance(spec, dict) else {'dtype': spec}
+            unknown = set(spec) - set(self.CONSTRAINTS)
+            if unknown:
+                raise ValueError(f"Unknown constraints for column {column}: {sorted(unknown)}")
+            if 'regex' in spec:
+                spec['regex'] = re.compile(spec['regex']).pattern
+            if 'allowed' in spec:
+                spec['allowed'] = list(spec['allowed'])
+            self.schema[column] = spec
+        self.reset()
+
+    def reset(self):
+        self.report = ValidationReport()
+        # Uniqueness spans chunks, so only 64-bit value hashes are kept rather than the values themselves
+        self.unique_hashes: Dict[str, List[np.ndarray]] = {column: [] for column, spec in self.schema.items()
+                                                           if spec.get('unique')}
+
+    def _examples(self, values: pd.Series, mask) -> List[Any]:
+        offending = values[mask]
+        return [{'row': index, 'value': value} for index, value in
+                zip(offending.index[:self.max_examples].tolist(), offending.iloc[:self.max_examples].tolist())]
+
+    def update(self, chunk: pd.DataFrame) -> ValidationReport:
+        report = self.report
+        report.rows += len(chunk)
+        report.chunks += 1
+        for column, spec in self.schema.items():
+            if column not in chunk.columns:
+                if 'missing' not in report.violations.get(column, {}):
+                    report.add(column, 'missing', 1, [], self.max_examples)
+                continue
+            series = chunk[column]
+            if 'dtype' in spec and series.dtype != spec['dtype']:
+                report.add(column, 'dtype', len(series), [{'expected': str(spec['dtype']), 'actual': str(series.dtype)}],
+                           self.max_examples)
+
+            nulls = series.isna()
+            if not spec.get('nullable', True):
+                report.add(column, 'nullable', int(nulls.sum()), self._examples(series, nulls), self.max_examples)
+            values = series[~nulls]
+            if values.empty:
+                continue
+
+            try:
+                if 'min' in spec:
+                    below = (values < spec['min']).to_numpy()
+                    report.add(column, 'min', int(below.sum()), self._examples(values, below), self.max_examples)
+                if 'max' in spec:
+                    above = (values > spec['max']).to_numpy()
+                    report.add(column, 'max', int(above.sum()), self._examples(values, above), self.max_examples)
+            except TypeError as e:
+                report.add(column, 'range', len(values), [{'error': str(e)}], self.max_examples)
+            if 'allowed' in spec:
+                outside = ~values.isin(spec['allowed']).to_numpy()
+                report.add(column, 'allowed', int(outside.sum()), self._examples(values, outside), self.max_examples)
+            if 'regex' in spec:
+                mismatched = ~values.astype(str).str.fullmatch(spec['regex']).to_numpy(dtype=bool)
+                report.add(column, 'regex', int(mismatched.sum()), self._examples(values, mismatched),
+                           self.max_examples)
+            if column in self.unique_hashes:
+                self.unique_hashes[column].append(pd.util.hash_pandas_object(values, index=False).to_numpy())
+        return report
+
+    def finalize(self) -> ValidationReport:
+        for column, parts in self.unique_hashes.items():
+            if not parts:
+                continue
+            hashes = np.concatenate(parts)
+            _, counts = np.unique(hashes, return_counts=True)
+            duplicates = int((counts - 1)[counts > 1].sum())
+            # Hashes stay around so finalize can be called again after more chunks arrive
+            self.unique_hashes[column] = [hashes]
+            self.report.violations.get(column, {}).pop('unique', None)
+            if column in self.report.violations and not self.report.violations[column]:
+                del self.report.violations[column]
+            self.report.add(column, 'unique', duplicates, [], self.max_examples)
+        return self.report
+
+    def validate(self, data: pd.DataFrame, sample: Union[int, float, None] = None, chunk_size: Optional[int] = None,
+                 seed: int = 0) -> ValidationReport:
+        # sample takes a row count or a fraction; chunk_size bounds the temporary masks on very wide frames
+        self.reset()
+        if sample is not None:
+            if isinstance(sample, float):
+                data = data.sample(frac=sample, random_state=seed)
+            elif sample < len(data):
+                data = data.sample(n=sample, random_state=seed)
+            self.report.sampled = True
+        if chunk_size:
+            for start in range(0, len(data), chunk_size):
+                self.update(data.iloc[start:start + chunk_size])
+        else:
+            self.update(data)
+        return self.finalize()
+
+    def watch(self, chunks: Iterator[pd.DataFrame]) -> Iterator[pd.DataFrame]:
+        # Validates chunks as they stream past, so a streaming ingest is checked without a second read
+        self.reset()
+        for chunk in chunks:
+            self.update(chunk)
+            yield chunk
+        report = self.finalize()
+        if report.is_valid:
+            self.logger.info(f"Streamed data passed validation ({report.rows} rows)")
+        else:
+            self.logger.warning(f"Streamed data has {report.violation_count} constraint violations")
@@ -1,31 +1,8 @@
 import logging
-import pandas as pd
+import os
 import time
-from queue import Empty
-
-from api_gateway.router import APIRouter
-from core.kernel import Kernel
-from ai_integration.connector_hub import ConnectorHub
-from ai_integration.model_registry import ModelRegistry
-from ai_integration.training_pipeline import TrainingPipeline
-from data_management.data_intake import DataIntake
-from data_management.preprocessing import Preprocessor
-from data_management.storage_manager import StorageManager
-from task_orchestration.scheduler import TaskScheduler
-from task_orchestration.load_balancer import LoadBalancer
-from task_orchestration.result_aggregator import ResultAggregator
-from security.authentication import Authentication
-from security.encryption import Encryption
-from security.access_control import AccessControl, Role, Permission
-from monitoring.performance_monitor import PerformanceMonitor
-from monitoring.error_logger import ErrorLogger
-from monitoring.usage_analytics import UsageAnalytics
-from extension.plugin_manager import PluginManager
-from extension.service_discovery import ServiceDiscovery
-from extension.config_updater import ConfigUpdater
-from ui_adapter.command_interpreter import CommandInterpreter
-from ui_adapter.response_formatter import ResponseFormatter
-from ui_adapter.event_broadcaster import EventBroadcaster
+
+from core.startup_profiler import StartupProfiler
 
 def setup_logging():
     logging.basicConfig(level=logging.INFO,
@@ -56,42 +33,58 @@ def main():
     logger = logging.getLogger(__name__)
 
     logger.info("Starting AI System")
-    kernel = Kernel()
-    connector_hub = ConnectorHub()
-    model_registry = ModelRegistry()
-    training_pipeline = TrainingPipeline(model_registry)
-    data_intake = DataIntake()
-    preprocessor = Preprocessor()
-    storage_manager = StorageManager()
+    profiler = StartupProfiler(budget=float(os.environ["STARTUP_BUDGET"]) if "STARTUP_BUDGET" in os.environ else None)
+    load = profiler.load
+
+    # Heavy dependencies (pandas, scikit-learn, cryptography, ...) are only imported by the subsystems that
+    # use them, and components not needed during startup are built on first use
+    with profiler.component("kernel"):
+        kernel = load("core.kernel", "Kernel")()
+    with profiler.component("ai_integration"):
+        connector_hub = load("ai_integration.connector_hub", "ConnectorHub")()
+        model_registry = load("ai_integration.model_registry", "ModelRegistry")()
+    training_pipeline = profiler.lazy("training_pipeline", "ai_integration.training_pipeline", "TrainingPipeline",
+                                      model_registry)
+    data_intake = profiler.lazy("data_intake", "data_management.data_intake", "DataIntake")
+    preprocessor = profiler.lazy("preprocessor", "data_management.preprocessing", "Preprocessor")
+    storage_manager = profiler.lazy("storage_manager", "data_management.storage_manager", "StorageManager")
 
     # Initialize task orchestration components
-    task_scheduler = TaskScheduler(max_workers=5)
-    load_balancer = LoadBalancer()
-    result_aggregator = ResultAggregator()
+    with profiler.component("task_orchestration"):
+        task_scheduler = load("task_orchestration.scheduler", "TaskScheduler")(max_workers=5)
+    load_balancer = profiler.lazy("load_balancer", "task_orchestration.load_balancer", "LoadBalancer")
+    result_aggregator = profiler.lazy("result_aggregator", "task_orchestration.result_aggregator", "ResultAggregator")
 
     # Initialize security components
     secret_key = "your-secret-key"  # In a real scenario, this should be securely stored
-    auth = Authentication(secret_key)
-    encryption = Encryption()
-    access_control = AccessControl()
+    access_control_module = load("security.access_control")
+    Role, Permission = access_control_module.Role, access_control_module.Permission
+    with profiler.component("security"):
+        auth = load("security.authentication", "Authentication")(secret_key)
+        access_control = access_control_module.AccessControl()
+    encryption = profiler.lazy("encryption", "security.encryption", "Encryption")
 
     # Initialize monitoring components
-    performance_monitor = PerformanceMonitor(interval=10)
-    error_logger = ErrorLogger()
-    usage_analytics = UsageAnalytics()
+    with profiler.component("monitoring"):
+        performance_monitor = load("monitoring.performance_monitor", "PerformanceMonitor")(interval=10)
+        error_logger = load("monitoring.error_logger", "ErrorLogger")()
+        usage_analytics = load("monitoring.usage_analytics", "UsageAnalytics")()
 
     # Initialize API_gateway
-    api_router = APIRouter(kernel, auth, access_control)
+    with profiler.component("api_gateway"):
+        api_router = load("api_gateway.router", "APIRouter")(kernel, auth, access_control)
 
     # Initialize extension components
-    plugin_manager = PluginManager()
-    service_discovery = ServiceDiscovery("http://discovery-service-url")
-    config_updater = ConfigUpdater()
+    with profiler.component("extension"):
+        plugin_manager = load("extension.plugin_manager", "PluginManager")()
+        service_discovery = load("extension.service_discovery", "ServiceDiscovery")("http://discovery-service-url")
+    config_updater = profiler.lazy("config_updater", "extension.config_updater", "ConfigUpdater")
 
     # Initialize UI Adapter components
-    command_interpreter = CommandInterpreter()
-    response_formatter = ResponseFormatter()
-    event_broadcaster = EventBroadcaster()
+    with profiler.component("ui_adapter"):
+        command_interpreter = load("ui_adapter.command_interpreter", "CommandInterpreter")(dispatcher=kernel.dispatcher)
+        response_formatter = load("ui_adapter.response_formatter", "ResponseFormatter")()
+        event_broadcaster = load("ui_adapter.event_broadcaster", "EventBroadcaster")()
 
     # Simulating user database
     user_database = {
@@ -100,16 +93,20 @@ def main():
     }
 
     try:
-        kernel.start()
-        task_scheduler.start()
-        performance_monitor.start()
+        with profiler.component("startup.kernel"):
+            kernel.start()
+        with profiler.component("startup.workers"):
+            task_scheduler.start()
+            performance_monitor.start()
 
         # Load plugins
-        plugin_manager.load_plugins()
+        with profiler.component("startup.plugins"):
+            plugin_manager.load_plugins()
         logger.info(f"Loaded plugins: {plugin_manager.list_plugins()}")
 
         # Discover services
-        service_discovery.discover_services()
+        with profiler.component("startup.service_discovery"):
+            service_discovery.discover_services()
 
         # Adding a dummy AI connector
         dummy_connector = DummyAIConnector()
@@ -122,9 +119,11 @@ def main():
         # Adding a training config for the dummy model
         training_pipeline.add_training_config("dummy_model", {"epochs": 10, "batch_size": 32})
 
+        profiler.report()
+
         # Start the API server
         logger.info("Starting API server")
-        api_router.run(host="0.0.0.0", port=8000)
+        api_router.run(host="0.0.0.0", port=8000, workers=kernel.dynamic_config.get_config("gateway_workers", 1))
 
         # Simulating user login
         alice_token = auth.login("alice", "password123", user_database)
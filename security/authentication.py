@@ -1,12 +1,75 @@
 import bcrypt
 import jwt
+import hashlib
 import logging
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
+from threading import Lock
+
+
+class TokenCache:
+    def __init__(self, max_size=10000, max_ttl=300):
+        self.max_size = max_size
+        self.max_ttl = max_ttl  # in seconds
+        self.entries = OrderedDict()
+        self.lock = Lock()
+
+    def get(self, digest):
+        with self.lock:
+            entry = self.entries.get(digest)
+            if entry is None:
+                return None
+            user_id, expires_at = entry
+            if time.time() >= expires_at:
+                del self.entries[digest]
+                return None
+            self.entries.move_to_end(digest)
+            return user_id
+
+    def put(self, digest, user_id, token_exp):
+        expires_at = min(token_exp, time.time() + self.max_ttl)
+        with self.lock:
+            self.entries[digest] = (user_id, expires_at)
+            self.entries.move_to_end(digest)
+            if len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+
+    def invalidate(self, digest):
+        with self.lock:
+            self.entries.pop(digest, None)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+
+class TokenRevocationList:
+    def __init__(self):
+        self.revoked = {}
+        self.lock = Lock()
+
+    def revoke(self, digest, expires_at):
+        with self.lock:
+            self.revoked[digest] = expires_at
+            self._purge_expired()
+
+    def is_revoked(self, digest):
+        expires_at = self.revoked.get(digest)
+        return expires_at is not None and time.time() < expires_at
+
+    def _purge_expired(self):
+        now = time.time()
+        for digest in [d for d, expires_at in self.revoked.items() if expires_at <= now]:
+            del self.revoked[digest]
+
 
 class Authentication:
-    def __init__(self, secret_key, token_expiry=30):
+    def __init__(self, secret_key, token_expiry=30, cache_size=10000):
         self.secret_key = secret_key
         self.token_expiry = token_expiry  # in minutes
+        self.token_cache = TokenCache(max_size=cache_size)
+        self.revoked_tokens = TokenRevocationList()
         self.logger = logging.getLogger(__name__)
 
     def hash_password(self, password):
@@ -24,10 +87,24 @@ class Authentication:
         self.logger.info(f"Generated token for user {user_id}")
         return token
 
+    @staticmethod
+    def token_digest(token):
+        if isinstance(token, str):
+            token = token.encode('utf-8')
+        return hashlib.sha256(token).hexdigest()
+
     def verify_token(self, token):
+        digest = self.token_digest(token)
+        if self.revoked_tokens.is_revoked(digest):
+            self.logger.warning("Token has been revoked")
+            return None
+
+        user_id = self.token_cache.get(digest)
+        if user_id is not None:
+            return user_id
+
         try:
             payload = jwt.decode(token, self.secret_key, algorithms=['HS256'])
-            return payload['user_id']
         except jwt.ExpiredSignatureError:
             self.logger.warning("Token has expired")
             return None
@@ -35,6 +112,12 @@ class Authentication:
             self.logger.warning("Invalid token")
             return None
 
+        self.token_cache.put(digest, payload['user_id'], payload['exp'])
+        return payload['user_id']
+
+    def get_user_id_from_token(self, token):
+        return self.verify_token(token)
+
     def login(self, username, password, user_database):
         user = user_database.get(username)
         if user and self.check_password(password, user['password']):
@@ -45,10 +128,12 @@ class Authentication:
         return None
 
     def logout(self, token):
-        # In a real-world scenario, you might want to invalidate the token
-        # For simplicity, we'll just log the logout
         user_id = self.verify_token(token)
         if user_id:
+            digest = self.token_digest(token)
+            payload = jwt.decode(token, options={'verify_signature': False})
+            self.revoked_tokens.revoke(digest, payload['exp'])
+            self.token_cache.invalidate(digest)
             self.logger.info(f"User {user_id} logged out successfully")
             return True
-        return False
\ No newline at end of file
+        return False
@@ -1,5 +1,5 @@
-from security.authentication import Authentication
+from security.authentication import Authentication, TokenCache, TokenRevocationList
 from security.encryption import Encryption
 from security.access_control import AccessControl
 
-__all__ = ['Authentication', 'Encryption', 'AccessControl']
\ No newline at end of file
+__all__ = ['Authentication', 'TokenCache', 'TokenRevocationList', 'Encryption', 'AccessControl']
\ No newline at end of file
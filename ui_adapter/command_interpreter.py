@@ -3,7 +3,7 @@ from typing import Dict, Any
 
 
 class CommandInterpreter:
-    def __init__(self):
+    def __init__(self, dispatcher=None):
         self.logger = logging.getLogger(__name__)
         self.command_map = {
             "process_data": self._process_data,
@@ -12,15 +12,33 @@ class CommandInterpreter:
             "update_config": self._update_config,
             "get_system_status": self._get_system_status
         }
+        self.command_schemas = {
+            "process_data": {"data_source": str},
+            "train_model": {"model_name": str, "dataset": str},
+            "get_prediction": {"model_name": str, "input_data": None},
+            "update_config": {"new_config": dict},
+            "get_system_status": {}
+        }
+        self.dispatcher = dispatcher
+        if dispatcher is not None:
+            self.register_commands(dispatcher)
+
+    def register_commands(self, dispatcher):
+        for command, handler in self.command_map.items():
+            if command not in dispatcher.handlers:
+                dispatcher.register(command, handler, schema=self.command_schemas[command])
 
     def interpret_command(self, command: str, params: Dict[str, Any]) -> Dict[str, Any]:
         self.logger.info(f"Interpreting command: {command} with params: {params}")
-        if command not in self.command_map:
+        if self.dispatcher is None and command not in self.command_map:
             self.logger.error(f"Unknown command: {command}")
             return {"status": "error", "message": f"Unknown command: {command}"}
 
         try:
-            result = self.command_map[command](**params)
+            if self.dispatcher is not None:
+                result = self.dispatcher.dispatch(command, params)
+            else:
+                result = self.command_map[command](**params)
             return {"status": "success", "result": result}
         except Exception as e:
             self.logger.error(f"Error executing command {command}: {str(e)}")